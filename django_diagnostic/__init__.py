@@ -1,18 +1,67 @@
-# from django.utils.module_loading import autodiscover_modules
+import logging
+import threading
+import time
+from importlib import import_module
 
 __version__ = "1.8.1"
 
-# __all__ = [
-#     "autodiscover",
-# ]
+__all__ = [
+    "autodiscover",
+]
 
+module_logger = logging.getLogger(__name__)
 
-# class Bingo(object):
-#     _registry = {}
+# Host-app submodules imported at startup so their @Diagnostic.register
+# decorators run without anything else having to import them.
+DIAGNOSTIC_MODULES = ("diagnostic", "diagnostic_views")
 
+_autodiscover_lock = threading.Lock()
 
-# Foo = Bingo()
 
+def autodiscover() -> None:
+    """
+    Import the ``diagnostic`` and ``diagnostic_views`` modules of every
+    installed app, once per process, recording how long each import took in
+    ``Diagnostic.discovered``. As with Django's ``autodiscover_modules``, an
+    import error propagates; with ``DJANGO_DIAGNOSTIC_AUTODISCOVER_IGNORE_ERRORS``
+    set it is logged and recorded instead, and startup carries on without
+    that module's reports.
+    """
+    from django.apps import apps
+    from django.conf import settings
+    from django.utils.module_loading import module_has_submodule
 
-# def autodiscover():
-#     autodiscover_modules("diagnostic", "diagnostic_views", "diagnostic_views.")
+    from django_diagnostic.decorators import Diagnostic
+
+    with _autodiscover_lock:
+        if Diagnostic.discovered is not None:
+            return
+
+        discovered = []
+        for app_config in apps.get_app_configs():
+            for name in DIAGNOSTIC_MODULES:
+                if not module_has_submodule(app_config.module, name):
+                    continue
+                module = f"{app_config.name}.{name}"
+                error = None
+                started = time.perf_counter()
+                try:
+                    import_module(module)
+                except Exception as e:
+                    if not getattr(
+                        settings, "DJANGO_DIAGNOSTIC_AUTODISCOVER_IGNORE_ERRORS", False
+                    ):
+                        raise
+                    error = f"{e.__class__.__name__}: {e}"
+                    module_logger.exception(
+                        "Diagnostic autodiscovery of %s failed", module
+                    )
+                discovered.append(
+                    {
+                        "app_label": app_config.label,
+                        "module": module,
+                        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                        "error": error,
+                    }
+                )
+        Diagnostic.discovered = tuple(discovered)
@@ -3,7 +3,8 @@ from django.apps import AppConfig
 
 class DjangoDiagnosticConfig(AppConfig):
     name = "django_diagnostic"
+    default_auto_field = "django.db.models.BigAutoField"
 
-    # def ready(self):
-    #     super().ready()
-    #     self.module.autodiscover()
+    def ready(self) -> None:
+        super().ready()
+        self.module.autodiscover()
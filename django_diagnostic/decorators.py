@@ -1,8 +1,12 @@
 import logging
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, TypeVar
 
 from django.core.validators import slug_re
+from django.utils.module_loading import cached_import
 from django.utils.text import slugify
 
 module_logger = logging.getLogger(__name__)
@@ -10,10 +14,178 @@ module_logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class Registry(dict):
+    """``dict`` of registrations that counts its mutations, so the index built
+    from it knows when it has gone stale."""
+
+    version = 0
+
+    def _changed(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, key: str, value: dict[str, Any]) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other: Mapping) -> "Registry":
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def pop(self, *args) -> Any:  # noqa: ANN401
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self) -> tuple[str, dict[str, Any]]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key: str, default: Any = None) -> Any:  # noqa: ANN401
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+
+@dataclass(frozen=True)
+class RegistryEntry:
+    registry_key: str
+    app_name: str | None
+    slug: str | None
+    module: str | None
+    name: str | None
+    link_name: str | None
+    args: tuple = ()
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ResolvedView:
+    view_class: type | None
+    doc: str | None
+    import_error: str | None
+
+
+class RegistryIndex:
+    """
+    Immutable snapshot of the registry: entries sorted by key, and lookups by
+    key, by ``(app_name, slug)`` and by app. View classes and their view
+    callables are built on first use and remembered, so building the index
+    imports nothing and a dispatch loads only the report it serves.
+    """
+
+    def __init__(self, registry: Mapping[str, dict[str, Any]]) -> None:
+        self.entries = tuple(
+            RegistryEntry(
+                registry_key=registry_key,
+                app_name=value.get("app_name"),
+                slug=value.get("slug"),
+                module=value.get("module"),
+                name=value.get("name"),
+                link_name=value.get("kwargs", {}).get("link_name"),
+                args=tuple(value.get("args", ())),
+                kwargs=MappingProxyType(dict(value.get("kwargs", {}))),
+            )
+            for registry_key, value in sorted(registry.items())
+        )
+        self.by_key = MappingProxyType({e.registry_key: e for e in self.entries})
+        self.by_path = MappingProxyType({(e.app_name, e.slug): e for e in self.entries})
+        by_app: dict[str | None, list[RegistryEntry]] = {}
+        for entry in self.entries:
+            by_app.setdefault(entry.app_name, []).append(entry)
+        self.by_app = MappingProxyType(
+            {app_name: tuple(entries) for app_name, entries in by_app.items()}
+        )
+        self._resolved: dict[str, ResolvedView] = {}
+        self._views: dict[str, Callable[..., Any]] = {}
+
+    def lookup(self, app_name: str, slug: str) -> RegistryEntry | None:
+        """
+        The entry registered under ``app_name``/``slug``, matched directly
+        and only slugified into a registry key when that misses.
+        """
+        entry = self.by_path.get((app_name, slug))
+        if entry is None:
+            entry = self.by_key.get(Diagnostic.build_registry_key(app_name, slug))
+        return entry
+
+    def resolve(self, entry: RegistryEntry) -> ResolvedView:
+        """
+        The entry's view class, imported once per index. Import failures
+        are returned but not remembered, so a module that failed on a
+        transient error, or was fixed and reloaded, is tried again.
+        """
+        resolved = self._resolved.get(entry.registry_key)
+        if resolved is None:
+            try:
+                view_class = cached_import(entry.module, entry.name)
+            except (ImportError, AttributeError, TypeError) as e:
+                return ResolvedView(None, None, str(e))
+            resolved = ResolvedView(view_class, view_class.__doc__, None)
+            self._resolved[entry.registry_key] = resolved
+        return resolved
+
+    def get_view(self, entry: RegistryEntry) -> Callable[..., Any] | None:
+        """
+        ``as_view()`` of the entry's view class, built on first dispatch and
+        reused, or ``None`` if the class can't be imported.
+        """
+        view = self._views.get(entry.registry_key)
+        if view is None:
+            view_class = self.resolve(entry).view_class
+            if view_class is None:
+                return None
+            view = self._views[entry.registry_key] = view_class.as_view()
+        return view
+
+
 class Diagnostic:
     """Registry of superuser diagnostic reports, built-in and host-app registered."""
 
-    registry: dict[str, dict[str, Any]] = {}
+    registry: dict[str, dict[str, Any]] = Registry()
+
+    # Filled in by django_diagnostic.autodiscover(): one record per host-app
+    # module imported, with its import time. None until discovery has run.
+    discovered: tuple[dict[str, Any], ...] | None = None
+
+    _index: RegistryIndex | None = None
+    _index_version: int | None = None
+    _index_lock = threading.Lock()
+
+    @classmethod
+    def get_index(cls) -> RegistryIndex:
+        """
+        The index for the current registry, rebuilt only after the registry
+        has changed.
+        """
+        registry = cls.registry
+        # a plain dict assigned over the registry can't report changes
+        version = getattr(registry, "version", None)
+
+        def stale() -> bool:
+            return (
+                cls._index is None or version is None or version != cls._index_version
+            )
+
+        if stale():
+            with cls._index_lock:
+                if stale():
+                    cls._index = RegistryIndex(registry)
+                    cls._index_version = version
+        return cls._index
 
     @classmethod
     def build_registry_key(cls, app_name: str, slug: str) -> str:
@@ -23,33 +195,44 @@ class Diagnostic:
     @classmethod
     def register(cls, *args, **kwargs) -> Callable[[type[T]], type[T]]:
         def decorator(fn: type[T]) -> type[T]:
-            slug = slugify(kwargs["slug"], allow_unicode=True)
-            app_name = fn.__module__.split(".")[0]
-
-            if not slug_re.match(slug):
-                module_logger.debug(
-                    "unable to register diagnostic, invalid slug: %s", slug
-                )
-                return fn
-
-            registration = {
-                "name": fn.__name__,
-                "module": fn.__module__,
-                "app_name": app_name,
-                "slug": slug,
-                "args": args,
-                "kwargs": kwargs,
-            }
-
-            registry_key = cls.build_registry_key(app_name, slug)
-            if registry_key not in cls.registry:
-                cls.registry[registry_key] = registration
-                module_logger.debug(
-                    "registered diagnostic %s at registry key: %s",
-                    registration["name"],
-                    registry_key,
-                )
-
+            cls.add(fn.__module__, fn.__name__, *args, **kwargs)
             return fn
 
         return decorator
+
+    @classmethod
+    def register_lazy(cls, dotted_path: str, *args, **kwargs) -> None:
+        """
+        Register the view at ``dotted_path`` without importing it, so its
+        module -- and whatever optional dependencies it pulls in -- loads
+        only when the report is dispatched.
+        """
+        module, _, name = dotted_path.rpartition(".")
+        cls.add(module, name, *args, **kwargs)
+
+    @classmethod
+    def add(cls, module: str, name: str, *args, **kwargs) -> None:
+        slug = slugify(kwargs["slug"], allow_unicode=True)
+        app_name = module.split(".")[0]
+
+        if not slug_re.match(slug):
+            module_logger.debug("unable to register diagnostic, invalid slug: %s", slug)
+            return
+
+        registration = {
+            "name": name,
+            "module": module,
+            "app_name": app_name,
+            "slug": slug,
+            "args": args,
+            "kwargs": kwargs,
+        }
+
+        registry_key = cls.build_registry_key(app_name, slug)
+        if registry_key not in cls.registry:
+            cls.registry[registry_key] = registration
+            module_logger.debug(
+                "registered diagnostic %s at registry key: %s",
+                registration["name"],
+                registry_key,
+            )
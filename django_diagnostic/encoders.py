@@ -0,0 +1,40 @@
+import dataclasses
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.utils.module_loading import import_string
+
+
+class DiagnosticJSONEncoder(DjangoJSONEncoder):
+    """
+    ``DjangoJSONEncoder`` (datetimes, Decimals, UUIDs, lazy strings) that
+    also takes the other shapes report contexts hold -- sets, querysets,
+    mappings, dataclasses -- and falls back to ``str()`` rather than failing
+    a whole report over one unusual value. Tuples encode as arrays natively.
+    """
+
+    def default(self, o: Any) -> Any:  # noqa: ANN401
+        if isinstance(o, (set, frozenset, QuerySet)):
+            return list(o)
+        if isinstance(o, Mapping):
+            return dict(o)
+        if dataclasses.is_dataclass(o) and not isinstance(o, type):
+            return dataclasses.asdict(o)
+        if isinstance(o, bytes):
+            return o.decode(errors="replace")
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+def get_json_encoder() -> type[json.JSONEncoder]:
+    """The encoder named by ``DJANGO_DIAGNOSTIC_JSON_ENCODER``, if set."""
+    dotted_path = getattr(settings, "DJANGO_DIAGNOSTIC_JSON_ENCODER", None)
+    if dotted_path:
+        return import_string(dotted_path)
+    return DiagnosticJSONEncoder
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_diagnostic.models import TaskResultRollup
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold Celery task results completed since the last run into the "
+        "hourly rollups behind the Celery Results Summary report."
+    )
+
+    def handle(self, *args, **options) -> None:  # noqa: ARG002
+        try:
+            written = TaskResultRollup.objects.update_from_task_results()
+        except ImportError as e:
+            raise CommandError("django-celery-results is not installed") from e
+
+        self.stdout.write(f"Updated {written} rollup bucket(s).")
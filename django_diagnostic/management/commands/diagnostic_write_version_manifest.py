@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from django_diagnostic.views import HAS_GIT, read_git_metadata
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the running-code version manifest at build time, so diagnostic "
+        "pages read it instead of .git. Defaults to the "
+        "DJANGO_DIAGNOSTIC_VERSION_MANIFEST path."
+    )
+
+    def add_arguments(self, parser) -> None:  # noqa: ANN001
+        parser.add_argument(
+            "path",
+            nargs="?",
+            default=getattr(settings, "DJANGO_DIAGNOSTIC_VERSION_MANIFEST", None),
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: ARG002
+        if not options["path"]:
+            raise CommandError("Pass a path or set DJANGO_DIAGNOSTIC_VERSION_MANIFEST.")
+        if not HAS_GIT:
+            raise CommandError("GitPython is not installed")
+
+        from git import (  # ty: ignore[unresolved-import]
+            GitCommandError,
+            InvalidGitRepositoryError,
+            NoSuchPathError,
+            Repo,
+        )
+
+        try:
+            repo = Repo(search_parent_directories=True)
+        except (InvalidGitRepositoryError, NoSuchPathError) as e:
+            raise CommandError(f"Not inside a git repository: {e}") from e
+
+        try:
+            manifest = read_git_metadata(repo)
+            manifest["git_dirty"] = repo.is_dirty()
+        except (GitCommandError, TypeError, ValueError) as e:
+            # e.g. a repository with no commits yet
+            raise CommandError(f"Could not read git metadata: {e}") from e
+        manifest["built_at"] = timezone.now().isoformat()
+
+        path = Path(options["path"])
+        path.write_text(json.dumps(manifest, separators=(",", ":")))
+        self.stdout.write(f"Wrote version manifest to {path}.")
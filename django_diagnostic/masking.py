@@ -0,0 +1,174 @@
+import copy
+import dataclasses
+import re
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any
+
+from django.conf import settings
+
+MASK = "******"
+
+SENSITIVE_KEYS = ("SECRET", "PASSWORD", "TOKEN", "HMAC", "KEY")
+WHITELISTED_KEYS = (
+    "PASSWORD_HASHERS",
+    "CHANGE_PASSWORD",
+    "RESET_PASSWORD",
+    "RESET_PASSWORD_FROM_KEY",
+)
+QUERY_SECRET_KEYS = ("SENTRY_KEY", "TOKEN", "API_KEY", "PASSWORD", "SECRET")
+
+# Match user:password@ in URLs
+URL_PASSWORD_RE = re.compile(r"([a-zA-Z][a-zA-Z0-9+.-]*:\/\/[^/:]+:)([^@]+)(@)")
+
+
+class SecretMasker:
+    """
+    Masks secrets in settings and environment values. Keys are matched
+    case-insensitively against one alternation of the sensitive patterns,
+    with exact whitelist exemptions; the decision is memoized per key, since
+    the same few hundred keys come back on every page. Strings that look
+    like URLs have their password and secret query parameters masked
+    instead.
+    """
+
+    def __init__(
+        self,
+        sensitive_keys: Iterable[str] = SENSITIVE_KEYS,
+        whitelisted_keys: Iterable[str] = WHITELISTED_KEYS,
+        query_secret_keys: Iterable[str] = QUERY_SECRET_KEYS,
+    ) -> None:
+        patterns = sorted({k.upper() for k in sensitive_keys}, key=len, reverse=True)
+        # (?!) never matches, so an empty pattern list masks nothing
+        self.sensitive_re = re.compile("|".join(map(re.escape, patterns)) or "(?!)")
+        self.whitelisted_keys = frozenset(k.upper() for k in whitelisted_keys)
+        self.query_secret_keys = frozenset(k.upper() for k in query_secret_keys)
+        self.is_sensitive_key = lru_cache(maxsize=4096)(self._is_sensitive_key)
+
+    def _is_sensitive_key(self, key: str) -> bool:
+        key = key.upper()
+        if key in self.whitelisted_keys:
+            return False
+        return self.sensitive_re.search(key) is not None
+
+    def mask_query_params(self, url: str) -> str:
+        if "?" not in url:
+            return url
+        base, query = url.split("?", 1)
+        parts = []
+        for pair in query.split("&"):
+            k, sep, v = pair.partition("=")
+            if k.upper() in self.query_secret_keys:
+                v = MASK
+            parts.append(f"{k}{sep}{v}")
+        return f"{base}?{'&'.join(parts)}"
+
+    def mask_url(self, value: str) -> str:
+        return self.mask_query_params(URL_PASSWORD_RE.sub(rf"\1{MASK}\3", value))
+
+    def mask(self, key: str, value: Any) -> Any:  # noqa: ANN401
+        """
+        ``value`` with its secrets masked. Containers are walked structurally
+        -- mappings by their own keys, sequences and sets under ``key``,
+        dataclasses and ``SimpleNamespace`` objects by attribute name -- and
+        returned as-is when nothing inside them changed, so large settings
+        trees aren't copied to mask nothing. A container met again inside
+        itself is left unwalked.
+        """
+        return self._mask(key, value, set())
+
+    def _mask(self, key: str, value: Any, active: set[int]) -> Any:  # noqa: ANN401, C901
+        if isinstance(value, str):
+            if ("?" in value and "=" in value) or (
+                "://" in value and URL_PASSWORD_RE.search(value)
+            ):
+                return self.mask_url(value)
+            return MASK if self.is_sensitive_key(key) else value
+
+        if value is None or isinstance(value, (bool, int, float, bytes, type)):
+            return value
+        if id(value) in active:
+            return value
+
+        active.add(id(value))
+        try:
+            if isinstance(value, (list, tuple, set, frozenset)):
+                items = []
+                changed = False
+                for v in value:
+                    masked = self._mask(key, v, active)
+                    changed = changed or masked is not v
+                    items.append(masked)
+                if not changed:
+                    return value
+                if isinstance(value, tuple) and hasattr(value, "_fields"):
+                    return type(value)._make(items)
+                return type(value)(items)
+
+            # dict first: the ABC check is slow and most trees are plain dicts
+            if isinstance(value, dict) or isinstance(value, Mapping):  # noqa: SIM101
+                items = []
+                changed = False
+                for k, v in value.items():
+                    masked = self._mask(k if isinstance(k, str) else str(k), v, active)
+                    changed = changed or masked is not v
+                    items.append((k, masked))
+                if not changed:
+                    return value
+                try:
+                    return type(value)(items)
+                except TypeError:
+                    return dict(items)
+
+            if (
+                dataclasses.is_dataclass(value) and not isinstance(value, type)
+            ) or isinstance(value, SimpleNamespace):
+                names = (
+                    [field.name for field in dataclasses.fields(value)]
+                    if dataclasses.is_dataclass(value)
+                    else list(vars(value))
+                )
+                changes = {}
+                for name in names:
+                    attr = getattr(value, name)
+                    masked = self._mask(name, attr, active)
+                    if masked is not attr:
+                        changes[name] = masked
+                if not changes:
+                    return value
+                masked_value = copy.copy(value)
+                for name, masked in changes.items():
+                    # object.__setattr__ also works on frozen dataclasses
+                    object.__setattr__(masked_value, name, masked)
+                return masked_value
+        finally:
+            active.discard(id(value))
+
+        return value
+
+
+@lru_cache(maxsize=8)
+def build_secret_masker(
+    sensitive_keys: tuple[str, ...],
+    whitelisted_keys: tuple[str, ...],
+    query_secret_keys: tuple[str, ...],
+) -> SecretMasker:
+    return SecretMasker(sensitive_keys, whitelisted_keys, query_secret_keys)
+
+
+def get_secret_masker() -> SecretMasker:
+    """
+    The masker for the current ``DJANGO_DIAGNOSTIC_SENSITIVE_KEYS``,
+    ``DJANGO_DIAGNOSTIC_WHITELISTED_KEYS`` and
+    ``DJANGO_DIAGNOSTIC_QUERY_SECRET_KEYS``, compiled once per combination.
+    """
+    return build_secret_masker(
+        tuple(getattr(settings, "DJANGO_DIAGNOSTIC_SENSITIVE_KEYS", SENSITIVE_KEYS)),
+        tuple(
+            getattr(settings, "DJANGO_DIAGNOSTIC_WHITELISTED_KEYS", WHITELISTED_KEYS)
+        ),
+        tuple(
+            getattr(settings, "DJANGO_DIAGNOSTIC_QUERY_SECRET_KEYS", QUERY_SECRET_KEYS)
+        ),
+    )
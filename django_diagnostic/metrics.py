@@ -0,0 +1,177 @@
+import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from django_diagnostic.snapshots import get_executor, get_snapshot, store_snapshot
+
+module_logger = logging.getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# A collector returns its samples as (labels, value) pairs.
+Sample = tuple[dict[str, str], float]
+
+
+@dataclass(frozen=True)
+class Metric:
+    """
+    One OpenMetrics family. ``collect`` is the dotted path to a callable
+    returning its samples, imported only when the metric is first refreshed
+    so optional integrations stay unloaded until then. Samples are cached
+    for ``refresh_interval`` seconds, overridable per name through
+    ``DJANGO_DIAGNOSTIC_METRICS_REFRESH_INTERVALS``.
+    """
+
+    name: str
+    documentation: str
+    collect: str
+    metric_type: str = "gauge"
+    refresh_interval: int = 60
+
+    def get_refresh_interval(self) -> int:
+        intervals = getattr(settings, "DJANGO_DIAGNOSTIC_METRICS_REFRESH_INTERVALS", {})
+        return intervals.get(self.name, self.refresh_interval)
+
+
+DIAGNOSTIC_METRICS = (
+    Metric(
+        "django_diagnostic_postgresql_connections",
+        "Backends in pg_stat_activity by state.",
+        "django_diagnostic.reports.postgresql.collect_connection_metrics",
+        refresh_interval=15,
+    ),
+    Metric(
+        "django_diagnostic_postgresql_blocked_locks",
+        "Locks in pg_locks waiting to be granted.",
+        "django_diagnostic.reports.postgresql.collect_blocked_lock_metrics",
+        refresh_interval=15,
+    ),
+    Metric(
+        "django_diagnostic_postgresql_database_size_bytes",
+        "Size of the current database.",
+        "django_diagnostic.reports.postgresql.collect_database_size_metrics",
+        refresh_interval=300,
+    ),
+    Metric(
+        "django_diagnostic_celery_tasks",
+        "Celery task results rolled up from django-celery-results, by outcome.",
+        "django_diagnostic.reports.celery_results.collect_task_metrics",
+        metric_type="counter",
+    ),
+    Metric(
+        "django_diagnostic_sessions_active",
+        "Unexpired sessions in the session table.",
+        "django_diagnostic.views.collect_session_metrics",
+    ),
+)
+
+
+def get_metrics_executor() -> ThreadPoolExecutor:
+    return get_executor(
+        "metrics", getattr(settings, "DJANGO_DIAGNOSTIC_METRICS_WORKERS", 2)
+    )
+
+
+def metric_snapshot_key(metric: Metric) -> str:
+    return f"django_diagnostic:metric:{metric.name}"
+
+
+def refresh_metric(metric: Metric) -> list[Sample] | None:
+    """
+    Collect ``metric`` and store its samples as the snapshot scrapes are
+    served from. A failed collection is logged and leaves the previous
+    snapshot in place; returns None in that case.
+    """
+    try:
+        samples = list(import_string(metric.collect)())
+    except Exception as e:  # noqa: BLE001 -- collectors span the database and optional integrations
+        module_logger.warning("Diagnostic metric %s failed: %s", metric.name, e)
+        return None
+
+    store_snapshot(
+        metric_snapshot_key(metric),
+        samples,
+        metric.get_refresh_interval(),
+        getattr(settings, "DJANGO_DIAGNOSTIC_METRICS_STALE_TTL", 3600),
+    )
+    return samples
+
+
+def collect_metrics(
+    metrics: Iterable[Metric] = DIAGNOSTIC_METRICS,
+) -> list[tuple[Metric, list[Sample], float]]:
+    """
+    Each metric's snapshot samples with their age in seconds; never collects
+    inline. A metric with no snapshot yet is refreshed in the background and
+    left out until its first one lands. Snapshots older than
+    ``DJANGO_DIAGNOSTIC_METRICS_STALE_TTL`` seconds past their interval
+    expire rather than be served.
+    """
+    executor = get_metrics_executor()
+    collected = []
+    for metric in metrics:
+        snapshot = get_snapshot(
+            metric_snapshot_key(metric),
+            metric.get_refresh_interval(),
+            partial(refresh_metric, metric),
+            executor,
+            refresh_missing=True,
+        )
+        if snapshot is not None:
+            samples, age = snapshot
+            collected.append((metric, samples, age))
+
+    return collected
+
+
+def escape_label_value(value: Any) -> str:  # noqa: ANN401
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_sample(name: str, labels: dict[str, str], value: float) -> str:
+    if labels:
+        label_set = ",".join(
+            f'{label}="{escape_label_value(v)}"' for label, v in labels.items()
+        )
+        name = f"{name}{{{label_set}}}"
+    return f"{name} {value!r}" if isinstance(value, float) else f"{name} {value}"
+
+
+def render_openmetrics(collected: list[tuple[Metric, list[Sample], float]]) -> str:
+    """
+    OpenMetrics text exposition of ``collected``, followed by a
+    ``django_diagnostic_metric_age_seconds`` gauge giving each snapshot's
+    age, so stale metrics can be alerted on.
+    """
+    lines = []
+    for metric, samples, _age in collected:
+        lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        sample_name = (
+            f"{metric.name}_total" if metric.metric_type == "counter" else metric.name
+        )
+        lines.extend(format_sample(sample_name, *sample) for sample in samples)
+
+    if collected:
+        lines.append("# TYPE django_diagnostic_metric_age_seconds gauge")
+        lines.append(
+            "# HELP django_diagnostic_metric_age_seconds "
+            "Age of the snapshot each metric is served from."
+        )
+        lines.extend(
+            format_sample(
+                "django_diagnostic_metric_age_seconds",
+                {"metric": metric.name},
+                round(age, 3),
+            )
+            for metric, _samples, age in collected
+        )
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
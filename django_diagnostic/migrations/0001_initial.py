@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupHighWaterMark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('high_water_mark', models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TaskResultRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_name', models.CharField(blank=True, max_length=255)),
+                ('bucket', models.DateTimeField()),
+                ('total', models.PositiveBigIntegerField(default=0)),
+                ('successes', models.PositiveBigIntegerField(default=0)),
+                ('failures', models.PositiveBigIntegerField(default=0)),
+                ('earliest', models.DateTimeField(null=True)),
+                ('latest', models.DateTimeField(null=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('task_name', 'bucket'), name='django_diagnostic_rollup_task_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,152 @@
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Case, Count, IntegerField, Max, Min, When
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+CELERY_ROLLUP_HIGH_WATER_MARK = "celery_task_results"
+
+
+class TaskResultRollupManager(models.Manager):
+    def update_from_task_results(
+        self, now: datetime | None = None, max_windows: int | None = None
+    ) -> int:
+        """
+        Fold ``TaskResult`` rows completed since the high-water mark into the
+        hourly rollups and advance the mark. Only the index-backed
+        ``date_done`` range past the mark is read, in windows of
+        ``DJANGO_DIAGNOSTIC_CELERY_ROLLUP_WINDOW_HOURS`` each committed on
+        its own. Rows newer than ``DJANGO_DIAGNOSTIC_CELERY_ROLLUP_SETTLE_SECONDS``
+        are left for the next run, since ``date_done`` is ``auto_now`` and
+        still moves while a task is in flight; a row saved again after it
+        has been rolled up is counted a second time. ``max_windows`` stops
+        after that many windows, leaving the rest for later runs.
+
+        Returns the number of rollup buckets written.
+        """
+        from django_celery_results.models import TaskResult  # ty: ignore[unresolved-import]
+
+        now = now or timezone.now()
+        settle = getattr(settings, "DJANGO_DIAGNOSTIC_CELERY_ROLLUP_SETTLE_SECONDS", 60)
+        window = timedelta(
+            hours=getattr(settings, "DJANGO_DIAGNOSTIC_CELERY_ROLLUP_WINDOW_HOURS", 24)
+        )
+        upper = now - timedelta(seconds=settle)
+
+        written = 0
+        windows = 0
+        while max_windows is None or windows < max_windows:
+            windows += 1
+            with transaction.atomic():
+                mark, _created = (
+                    RollupHighWaterMark.objects.select_for_update().get_or_create(
+                        name=CELERY_ROLLUP_HIGH_WATER_MARK
+                    )
+                )
+                lower = mark.high_water_mark
+                if lower is None:
+                    lower = TaskResult.objects.aggregate(earliest=Min("date_done"))[
+                        "earliest"
+                    ]
+                    if lower is None:
+                        return written
+                if lower >= upper:
+                    return written
+
+                window_end = min(lower + window, upper)
+                written += self._fold(
+                    TaskResult.objects.filter(
+                        date_done__gte=lower, date_done__lt=window_end
+                    )
+                )
+                mark.high_water_mark = window_end
+                mark.save(update_fields=["high_water_mark"])
+        return written
+
+    def _fold(self, task_results: models.QuerySet) -> int:
+        rows = (
+            task_results.annotate(bucket=TruncHour("date_done"))
+            .values("task_name", "bucket")
+            .annotate(
+                total=Count("id"),
+                earliest=Min("date_done"),
+                latest=Max("date_done"),
+                successes=Count(
+                    Case(When(status="SUCCESS", then=1), output_field=IntegerField())
+                ),
+                failures=Count(
+                    Case(When(status="FAILURE", then=1), output_field=IntegerField())
+                ),
+            )
+            .order_by()
+        )
+
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        existing = {
+            (rollup.task_name, rollup.bucket): rollup
+            for rollup in self.filter(
+                task_name__in={row["task_name"] or "" for row in rows},
+                bucket__in={row["bucket"] for row in rows},
+            )
+        }
+        new = {}
+        updated = {}
+        for row in rows:
+            key = (row["task_name"] or "", row["bucket"])
+            rollup = existing.get(key) or new.get(key)
+            if rollup is None:
+                rollup = new[key] = self.model(task_name=key[0], bucket=key[1])
+            elif key in existing:
+                updated[key] = rollup
+            rollup.total += row["total"]
+            rollup.successes += row["successes"]
+            rollup.failures += row["failures"]
+            rollup.earliest = min(filter(None, (rollup.earliest, row["earliest"])))
+            rollup.latest = max(filter(None, (rollup.latest, row["latest"])))
+
+        self.bulk_create(new.values())
+        self.bulk_update(
+            updated.values(),
+            ["total", "successes", "failures", "earliest", "latest"],
+        )
+        return len(updated) + len(new)
+
+
+class TaskResultRollup(models.Model):
+    """Hourly per-task counts of django_celery_results ``TaskResult`` rows."""
+
+    task_name = models.CharField(max_length=255, blank=True)
+    bucket = models.DateTimeField()
+    total = models.PositiveBigIntegerField(default=0)
+    successes = models.PositiveBigIntegerField(default=0)
+    failures = models.PositiveBigIntegerField(default=0)
+    earliest = models.DateTimeField(null=True)
+    latest = models.DateTimeField(null=True)
+
+    objects = TaskResultRollupManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task_name", "bucket"],
+                name="django_diagnostic_rollup_task_bucket",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.task_name} @ {self.bucket:%Y-%m-%d %H:00}"
+
+
+class RollupHighWaterMark(models.Model):
+    """How far each incremental rollup has read its source table."""
+
+    name = models.CharField(max_length=100, unique=True)
+    high_water_mark = models.DateTimeField(null=True)
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.high_water_mark}"
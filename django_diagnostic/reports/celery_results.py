@@ -0,0 +1,374 @@
+import math
+import random
+from datetime import datetime, timedelta
+from typing import Any
+
+from braces.views import SuperuserRequiredMixin
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.db.models import (
+    Aggregate,
+    Case,
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    Max,
+    Min,
+    QuerySet,
+    Sum,
+    When,
+)
+from django.db.models.functions import Trunc
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from django.views.generic import TemplateView
+
+from django_diagnostic.models import (
+    CELERY_ROLLUP_HIGH_WATER_MARK,
+    RollupHighWaterMark,
+    TaskResultRollup,
+)
+
+# django-celery-results is an optional extra (`django-diagnostic[celery_results]`)
+# and its models can only be imported once it is in INSTALLED_APPS.
+HAS_TASK_RESULT = False
+if apps.is_installed("django_celery_results"):
+    from django_celery_results.models import TaskResult  # ty: ignore[unresolved-import]
+
+    HAS_TASK_RESULT = True
+
+
+# Window selector values for the Celery results summary: how far back to
+# look, and the Trunc kind used for its histogram buckets. "all" renders
+# from the rollups instead of the TaskResult table.
+CELERY_RESULTS_WINDOWS = {
+    "15m": (timedelta(minutes=15), "minute"),
+    "1h": (timedelta(hours=1), "minute"),
+    "24h": (timedelta(hours=24), "hour"),
+    "7d": (timedelta(days=7), "day"),
+    "all": (None, None),
+}
+
+SUCCESS_COUNT = Count(Case(When(status="SUCCESS", then=1), output_field=IntegerField()))
+FAILURE_COUNT = Count(Case(When(status="FAILURE", then=1), output_field=IntegerField()))
+
+
+def sum_task_rows(tasks: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Totals across the per-task rows, folded in Python so the summary does
+    not scan the table a second time for the same conditional counts.
+    """
+    totals = {"total": 0, "successes": 0, "failures": 0}
+    for task in tasks:
+        for field in totals:
+            totals[field] += task[field] or 0
+    earliest = [task["earliest"] for task in tasks if task["earliest"]]
+    latest = [task["latest"] for task in tasks if task["latest"]]
+    totals["earliest"] = min(earliest, default=None)
+    totals["latest"] = max(latest, default=None)
+    return totals
+
+
+def truncate_datetime(value: datetime, kind: str) -> datetime:
+    """Python twin of ``Trunc(kind)`` in the current timezone."""
+    value = timezone.localtime(value).replace(second=0, microsecond=0)
+    if kind in ("hour", "day"):
+        value = value.replace(minute=0)
+    if kind == "day":
+        value = value.replace(hour=0)
+    return value
+
+
+def task_result_histogram(
+    since: datetime, kind: str, now: datetime
+) -> tuple[list[datetime], dict[str, list[dict[str, Any]]]]:
+    """
+    Per-task success and failure counts in fixed ``kind`` buckets since
+    ``since``, from one grouped query. Empty buckets are filled with zeros
+    so every task's row lines up with the returned bucket list.
+    """
+    step = {"minute": timedelta(minutes=1), "hour": timedelta(hours=1)}.get(
+        kind, timedelta(days=1)
+    )
+    buckets = []
+    bucket = truncate_datetime(since, kind)
+    while bucket <= now:
+        buckets.append(bucket)
+        bucket = truncate_datetime(bucket + step, kind)
+
+    counts: dict[str, dict[datetime, dict[str, int]]] = {}
+    rows = (
+        TaskResult.objects.filter(date_done__gte=since)
+        .annotate(bucket=Trunc("date_done", kind))
+        .values("task_name", "bucket")
+        .annotate(successes=SUCCESS_COUNT, failures=FAILURE_COUNT)
+        .order_by()
+    )
+    for row in rows:
+        counts.setdefault(row["task_name"], {})[row["bucket"]] = row
+
+    histogram = {
+        task_name: [
+            {
+                "bucket": bucket,
+                "successes": by_bucket.get(bucket, {}).get("successes", 0),
+                "failures": by_bucket.get(bucket, {}).get("failures", 0),
+            }
+            for bucket in buckets
+        ]
+        for task_name, by_bucket in sorted(
+            counts.items(), key=lambda item: item[0] or ""
+        )
+    }
+    return buckets, histogram
+
+
+RUNTIME_PERCENTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+CELERY_RESULTS_SORTS = ("task_name", *RUNTIME_PERCENTILES)
+
+
+class PercentileCont(Aggregate):
+    """PostgreSQL ``percentile_cont`` over the seconds of a duration."""
+
+    function = "PERCENTILE_CONT"
+    template = (
+        "%(function)s(%(percentile)s) WITHIN GROUP "
+        "(ORDER BY EXTRACT(EPOCH FROM %(expressions)s))"
+    )
+    output_field = FloatField()
+
+    def __init__(self, expression: Any, percentile: float, **extra) -> None:  # noqa: ANN401
+        super().__init__(expression, percentile=float(percentile), **extra)
+
+
+def task_runtime() -> ExpressionWrapper:
+    return ExpressionWrapper(
+        F("date_done") - F("date_created"), output_field=DurationField()
+    )
+
+
+def percentile_cont(values: list[float], percentile: float) -> float | None:
+    """Linear-interpolated percentile, matching PostgreSQL ``percentile_cont``."""
+    if not values:
+        return None
+    values = sorted(values)
+    position = percentile * (len(values) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def sampled_runtime_percentiles(
+    task_results: QuerySet, sample_size: int
+) -> dict[str, dict[str, float | None]]:
+    """
+    Runtime percentiles per task for backends without ``percentile_cont``:
+    stream the rows once and keep a bounded reservoir sample per task.
+    """
+    reservoirs: dict[str, list[float]] = {}
+    seen: dict[str, int] = {}
+    rows = task_results.values_list("task_name", "date_created", "date_done")
+    for task_name, date_created, date_done in rows.iterator(chunk_size=2000):
+        if date_created is None or date_done is None:
+            continue
+        runtime = (date_done - date_created).total_seconds()
+        reservoir = reservoirs.setdefault(task_name, [])
+        seen[task_name] = seen.get(task_name, 0) + 1
+        if len(reservoir) < sample_size:
+            reservoir.append(runtime)
+        else:
+            slot = random.randrange(seen[task_name])  # noqa: S311
+            if slot < sample_size:
+                reservoir[slot] = runtime
+
+    return {
+        task_name: {
+            name: percentile_cont(reservoir, percentile)
+            for name, percentile in RUNTIME_PERCENTILES.items()
+        }
+        for task_name, reservoir in reservoirs.items()
+    }
+
+
+def collect_task_metrics() -> list[tuple[dict[str, str], int]]:
+    """
+    Cumulative per-task success and failure counts from the rollups, caught
+    up by one window first when the summary page would do the same.
+    """
+    if not HAS_TASK_RESULT or settings.RESULTS_BACKEND != "django-db":
+        return []
+    if getattr(settings, "DJANGO_DIAGNOSTIC_CELERY_ROLLUP_ON_VIEW", False):
+        TaskResultRollup.objects.update_from_task_results(max_windows=1)
+
+    samples = []
+    for task in (
+        TaskResultRollup.objects.values("task_name")
+        .annotate(successes=Sum("successes"), failures=Sum("failures"))
+        .order_by("task_name")
+    ):
+        task_name = task["task_name"]
+        samples.append(
+            ({"task_name": task_name, "status": "success"}, task["successes"])
+        )
+        samples.append(
+            ({"task_name": task_name, "status": "failure"}, task["failures"])
+        )
+    return samples
+
+
+class CeleryResultsSummary(SuperuserRequiredMixin, TemplateView):
+    """
+    Summary of celery results from TaskResults table.
+    """
+
+    page_title = _("Celery Results Summary")
+    page_heading = _("Celery Results Summary")
+    json_context_keys = (
+        "window",
+        "sort",
+        "sort_unavailable",
+        "tasks",
+        "totals",
+        "since",
+        "buckets",
+        "histogram",
+        "rolled_up_to",
+    )
+
+    def get_template_names(self) -> str:
+        return "django_diagnostic/celery_results_summary.html"
+
+    def get_window(self) -> str:
+        window = self.request.GET.get("window", "all")
+        return window if window in CELERY_RESULTS_WINDOWS else "all"
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        window = self.get_window()
+        context["window"] = window
+        context["windows"] = list(CELERY_RESULTS_WINDOWS)
+        context["sort"] = self.get_sort()
+        context["sorts"] = CELERY_RESULTS_SORTS
+        if window == "all" and context["sort"] != "task_name":
+            # the rollups keep no runtimes, so there is nothing to sort by
+            context["sort_unavailable"] = context["sort"]
+            context["sort"] = "task_name"
+
+        if HAS_TASK_RESULT and settings.RESULTS_BACKEND == "django-db":
+            if window == "all":
+                context.update(self.get_rollup_context())
+            else:
+                context.update(self.get_window_context(window))
+
+        return context
+
+    def get_window_context(self, window: str) -> dict[str, Any]:
+        """
+        Summary over the last ``window``, with the time filter in SQL so the
+        ``date_done`` index bounds every query to the window.
+        """
+        now = timezone.now()
+        delta, kind = CELERY_RESULTS_WINDOWS[window]
+        since = now - delta
+        task_results = TaskResult.objects.filter(date_done__gte=since)
+
+        tasks = task_results.values("task_name").annotate(
+            total=Count("id"),
+            earliest=Min("date_done"),
+            latest=Max("date_done"),
+            successes=SUCCESS_COUNT,
+            failures=FAILURE_COUNT,
+        )
+        tasks = list(self.with_runtime_percentiles(task_results, tasks))
+        buckets, histogram = task_result_histogram(since, kind, now)
+
+        return {
+            "tasks": tasks,
+            "totals": sum_task_rows(tasks),
+            "since": since,
+            "buckets": buckets,
+            "histogram": histogram,
+        }
+
+    def get_sort(self) -> str:
+        sort = self.request.GET.get("sort", "task_name")
+        return sort if sort in CELERY_RESULTS_SORTS else "task_name"
+
+    def with_runtime_percentiles(
+        self, task_results: QuerySet, tasks: QuerySet
+    ) -> QuerySet | list[dict[str, Any]]:
+        """
+        Attach p50/p95/p99 runtimes (``date_done - date_created``, in
+        seconds) to the per-task rows, sorted by the ``?sort=`` column. On
+        PostgreSQL both happen in the grouped query via ``percentile_cont``;
+        elsewhere percentiles come from a streamed sample of at most
+        ``DJANGO_DIAGNOSTIC_CELERY_RUNTIME_SAMPLE_SIZE`` rows per task.
+        """
+        sort = self.get_sort()
+
+        if connections[task_results.db].vendor == "postgresql":
+            tasks = tasks.annotate(
+                **{
+                    name: PercentileCont(task_runtime(), percentile)
+                    for name, percentile in RUNTIME_PERCENTILES.items()
+                }
+            )
+            if sort == "task_name":
+                return tasks.order_by("task_name")
+            return tasks.order_by(F(sort).desc(nulls_last=True), "task_name")
+
+        percentiles = sampled_runtime_percentiles(
+            task_results,
+            getattr(settings, "DJANGO_DIAGNOSTIC_CELERY_RUNTIME_SAMPLE_SIZE", 1000),
+        )
+        rows = []
+        for task in tasks:
+            task.update(
+                percentiles.get(task["task_name"], dict.fromkeys(RUNTIME_PERCENTILES))
+            )
+            rows.append(task)
+
+        if sort == "task_name":
+            rows.sort(key=lambda task: task["task_name"] or "")
+        else:
+            rows.sort(
+                key=lambda task: (task[sort] is None, -(task[sort] or 0)),
+            )
+        return rows
+
+    def get_rollup_context(self) -> dict[str, Any]:
+        # Render from the rollups instead of grouping the whole TaskResult
+        # table. They are kept current by the diagnostic_rollup_celery_results
+        # command; opting in to DJANGO_DIAGNOSTIC_CELERY_ROLLUP_ON_VIEW also
+        # folds in one window per page view, so a long backlog never lands
+        # inside a single request. The page shows how far behind they are.
+        if getattr(settings, "DJANGO_DIAGNOSTIC_CELERY_ROLLUP_ON_VIEW", False):
+            TaskResultRollup.objects.update_from_task_results(max_windows=1)
+
+        tasks = list(
+            TaskResultRollup.objects.values("task_name")
+            .annotate(
+                total=Sum("total"),
+                earliest=Min("earliest"),
+                latest=Max("latest"),
+                successes=Sum("successes"),
+                failures=Sum("failures"),
+            )
+            .order_by("task_name")
+        )
+        rolled_up_to = (
+            RollupHighWaterMark.objects.filter(name=CELERY_ROLLUP_HIGH_WATER_MARK)
+            .values_list("high_water_mark", flat=True)
+            .first()
+        )
+
+        return {
+            "tasks": tasks,
+            "totals": sum_task_rows(tasks),
+            "rolled_up_to": rolled_up_to,
+        }
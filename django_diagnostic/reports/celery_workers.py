@@ -0,0 +1,162 @@
+import logging
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from braces.views import SuperuserRequiredMixin
+from django.conf import settings
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+from django.views.generic import TemplateView
+
+from django_diagnostic.snapshots import get_executor, run_bounded, split_outcomes
+
+HAS_CELERY = False
+try:
+    from celery import current_app as celery_current_app  # ty: ignore[unresolved-import]
+
+    HAS_CELERY = True
+except ImportError:
+    pass
+
+module_logger = logging.getLogger(__name__)
+
+
+# Broadcast inspect calls shown on the Celery page, keyed by the
+# ``celery.app.control.Inspect`` method that answers them.
+CELERY_INSPECT_CALLS = ("stats", "active", "reserved", "scheduled", "active_queues")
+
+
+def get_celery_app() -> Any:  # noqa: ANN401
+    """
+    The Celery app named by the ``DJANGO_DIAGNOSTIC_CELERY_APP`` dotted path,
+    else Celery's current app.
+    """
+    dotted_path = getattr(settings, "DJANGO_DIAGNOSTIC_CELERY_APP", None)
+    if dotted_path:
+        return import_string(dotted_path)
+    return celery_current_app
+
+
+def get_celery_executor() -> ThreadPoolExecutor:
+    # Separate from the probe pool: a broker that never answers parks a
+    # thread here until its own socket timeout, and must not starve probes.
+    return get_executor(
+        "celery", getattr(settings, "DJANGO_DIAGNOSTIC_CELERY_WORKERS", 8)
+    )
+
+
+def run_celery_call(name: str, call: Callable[[], Any]) -> dict[str, Any]:
+    outcome = {"result": None, "status": "ok", "error": None, "elapsed_ms": None}
+    started = time.perf_counter()
+    try:
+        outcome["result"] = call()
+    except Exception as e:  # noqa: BLE001 -- broker errors vary by transport
+        outcome["status"] = "error"
+        outcome["error"] = str(e) or e.__class__.__name__
+        module_logger.warning("Celery inspect %s failed: %s", name, e)
+    finally:
+        outcome["elapsed_ms"] = round((time.perf_counter() - started) * 1000)
+    return outcome
+
+
+def celery_queue_depths(app: Any, queue_names: Iterable[str]) -> dict[str, Any]:  # noqa: ANN401
+    """
+    Ready messages and consumers per configured queue, from a passive
+    ``queue_declare`` on one broker connection. A passive declare never
+    creates the queue; a missing queue is reported rather than raised.
+    """
+    depths = {}
+    with app.connection_for_read() as conn:
+        channel = conn.default_channel
+        for name in sorted(queue_names):
+            try:
+                ok = channel.queue_declare(queue=name, passive=True)
+            except Exception as e:  # noqa: BLE001 -- ChannelError and friends
+                depths[name] = {"messages": None, "consumers": None, "error": str(e)}
+                channel = conn.channel()
+            else:
+                depths[name] = {
+                    "messages": ok.message_count,
+                    "consumers": ok.consumer_count,
+                    "error": None,
+                }
+    return depths
+
+
+def inspect_celery(app: Any) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:  # noqa: ANN401
+    """
+    Run the broadcast inspect calls and the queue depth read concurrently,
+    each inspect call waiting at most ``DJANGO_DIAGNOSTIC_CELERY_INSPECT_TIMEOUT``
+    seconds for worker replies, so the page costs one reply window however
+    many calls it makes. A worker that doesn't answer in time is simply
+    absent from the replies; the same timeout plus a second of grace is the
+    backstop for calls stuck on the broker itself. Returns results and
+    statuses by call, as ``run_probes`` does.
+    """
+    timeout = getattr(settings, "DJANGO_DIAGNOSTIC_CELERY_INSPECT_TIMEOUT", 1.0)
+    inspect = app.control.inspect(timeout=timeout)
+
+    calls = {name: getattr(inspect, name) for name in CELERY_INSPECT_CALLS}
+    calls["queue_depths"] = lambda: celery_queue_depths(app, app.amqp.queues)
+    outcomes = run_bounded(
+        {name: partial(run_celery_call, name, call) for name, call in calls.items()},
+        get_celery_executor(),
+        timeout + 1,
+    )
+    return split_outcomes(outcomes)
+
+
+class CeleryView(SuperuserRequiredMixin, TemplateView):
+    """
+    Live Celery workers, their active, reserved and scheduled tasks, and
+    queue depths
+    """
+
+    page_title = _("Celery Diagnostic")
+    page_heading = _("Celery Diagnostic")
+    json_context_keys = (
+        "has_celery",
+        "broker_url",
+        "workers",
+        "queue_depths",
+        "probes",
+    )
+
+    def get_template_names(self) -> str:
+        return "django_diagnostic/celery.html"
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["has_celery"] = HAS_CELERY
+        if not HAS_CELERY:
+            return context
+
+        app = get_celery_app()
+        results, statuses = inspect_celery(app)
+        context.update(results)
+        context["probes"] = statuses
+        # kombu leaves the password out of as_uri()
+        with app.connection_for_read() as conn:
+            context["broker_url"] = conn.as_uri()
+
+        workers = set()
+        for name in CELERY_INSPECT_CALLS:
+            workers.update(results[name] or {})
+        context["workers"] = [
+            {
+                "name": worker,
+                "stats": (results["stats"] or {}).get(worker),
+                "active": (results["active"] or {}).get(worker, []),
+                "reserved": (results["reserved"] or {}).get(worker, []),
+                "scheduled": (results["scheduled"] or {}).get(worker, []),
+                "queues": [
+                    queue["name"]
+                    for queue in (results["active_queues"] or {}).get(worker, [])
+                ],
+            }
+            for worker in sorted(workers)
+        ]
+        return context
@@ -0,0 +1,807 @@
+import logging
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from braces.views import SuperuserRequiredMixin
+from django.conf import settings
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    DatabaseError,
+    connection,
+    connections,
+    transaction,
+)
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.utils.translation import gettext_lazy as _
+from django.views.generic import TemplateView
+from psycopg2.errorcodes import (
+    OBJECT_NOT_IN_PREREQUISITE_STATE,
+    QUERY_CANCELED,
+    UNDEFINED_TABLE,
+)
+from psycopg2.extensions import (
+    STATUS_BEGIN,
+    STATUS_IN_TRANSACTION,
+    STATUS_PREPARED,
+    STATUS_READY,
+)
+
+from django_diagnostic.snapshots import (
+    get_executor,
+    get_snapshot,
+    run_bounded,
+    split_outcomes,
+    store_snapshot,
+)
+
+module_logger = logging.getLogger(__name__)
+
+
+def fetch_scalar(cursor: Any, sql: str) -> Any:  # noqa: ANN401
+    cursor.execute(sql)
+    return cursor.fetchone()[0]
+
+
+def fetch_all(cursor: Any, sql: str) -> list[tuple]:  # noqa: ANN401
+    cursor.execute(sql)
+    return cursor.fetchall()
+
+
+STATUS_MAP = {
+    STATUS_READY: "Ready",
+    STATUS_BEGIN: "Transaction started",
+    STATUS_PREPARED: "Prepared",
+    STATUS_IN_TRANSACTION: "In transaction",
+}
+
+
+# Parameters the server reports to libpq in ParameterStatus messages, so
+# reading them costs no round trip.
+SERVER_PARAMETERS = (
+    "server_version",
+    "server_encoding",
+    "client_encoding",
+    "application_name",
+    "session_authorization",
+    "is_superuser",
+    "DateStyle",
+    "IntervalStyle",
+    "TimeZone",
+    "integer_datetimes",
+    "standard_conforming_strings",
+    "in_hot_standby",
+)
+
+
+def collect_connection_info(conn: BaseDatabaseWrapper) -> dict[str, Any]:
+    """
+    Connection metadata read from the single psycopg2 handle behind ``conn``.
+    Everything here is libpq client-side state, including the SSL details
+    that pg_stat_ssl would report, so it adds no queries and no cursors.
+    """
+    conn.ensure_connection()
+    pg_conn = conn.connection
+    info = pg_conn.info
+
+    status_code = pg_conn.status
+    ssl_in_use = info.ssl_in_use
+    return {
+        "server_version": pg_conn.server_version,
+        "status": f"{STATUS_MAP.get(status_code, 'Unknown')} ({status_code})",
+        "dsn": pg_conn.dsn,
+        "backend_pid": info.backend_pid,
+        "encoding": pg_conn.encoding,
+        "protocol_version": info.protocol_version,
+        "host": info.host,
+        "port": info.port,
+        "user": info.user,
+        "parameters": {
+            name: value
+            for name in SERVER_PARAMETERS
+            if (value := info.parameter_status(name)) is not None
+        },
+        "ssl_in_use": ssl_in_use,
+        "ssl": (
+            {name: info.ssl_attribute(name) for name in info.ssl_attribute_names}
+            if ssl_in_use
+            else {}
+        ),
+    }
+
+
+@dataclass(frozen=True)
+class Probe:
+    """
+    One independent catalog query; ``name`` is its context key. Probes with
+    ``snapshot`` set are served from a cached snapshot between refreshes.
+    """
+
+    name: str
+    sql: str
+    fetch: Callable[[Any, str], Any] = fetch_all
+    timeout_ms: int | None = None
+    snapshot: bool = False
+
+
+POSTGRESQL_PROBES = (
+    Probe(
+        "db_size",
+        "SELECT pg_size_pretty(pg_database_size(current_database()));",
+        fetch_scalar,
+    ),
+    Probe(
+        "db_extensions",
+        """
+        SELECT extname, extversion, nspname
+        FROM pg_extension
+        JOIN pg_namespace
+        ON pg_extension.extnamespace = pg_namespace.oid
+        ORDER BY extname;
+        """,
+    ),
+    Probe(
+        "db_table_sizes",
+        """
+        SELECT *, pg_size_pretty(total_bytes) AS total,
+        pg_size_pretty(index_bytes) AS INDEX,
+        pg_size_pretty(toast_bytes) AS toast,
+        pg_size_pretty(table_bytes) AS TABLE
+        FROM (
+            SELECT *,
+                total_bytes - index_bytes - COALESCE(toast_bytes,0)
+                AS table_bytes
+            FROM (
+                SELECT c.oid, nspname AS table_schema,
+                    relname AS TABLE_NAME,
+                    c.reltuples AS row_estimate,
+                    pg_total_relation_size(c.oid) AS total_bytes,
+                    pg_indexes_size(c.oid) AS index_bytes,
+                    pg_total_relation_size(reltoastrelid) AS toast_bytes
+                FROM pg_class c LEFT JOIN pg_namespace n
+                    ON n.oid = c.relnamespace
+                WHERE relkind = 'r'
+            ) a
+        ) a
+        ORDER BY table_bytes DESC
+        LIMIT 10;
+        """,
+        snapshot=True,
+    ),
+    Probe("db_checksums", "SHOW data_checksums;", fetch_scalar),
+    Probe(
+        "db_connections",
+        """
+        SELECT
+            COUNT(*) FILTER (WHERE state = 'active') AS active,
+            COUNT(*) FILTER (WHERE state = 'idle') AS idle,
+            COUNT(*) FILTER (WHERE state = 'idle in transaction')
+              AS idle_in_tx,
+            COUNT(*) AS total
+        FROM pg_stat_activity;
+        """,
+    ),
+    Probe(
+        "db_long_queries",
+        """
+        SELECT pid, now() - query_start, state,
+            wait_event_type, wait_event, query
+        FROM pg_stat_activity
+        WHERE state <> 'idle'
+        ORDER BY query_start ASC
+        LIMIT 10;
+        """,
+    ),
+    Probe(
+        "db_blocked_locks",
+        """
+        SELECT locktype, relation::regclass, mode
+        FROM pg_locks
+        WHERE NOT granted;
+        """,
+    ),
+)
+
+
+def run_probe(probe: Probe, using: str) -> dict[str, Any]:
+    """
+    Run ``probe`` on the calling thread's own connection to ``using``, inside
+    a transaction bounded by ``SET LOCAL statement_timeout`` on PostgreSQL so
+    the server cancels it rather than leaving it queued behind a lock.
+    Django connections are per-thread, so each pool worker queries
+    independently; the connection is closed afterwards so idle workers hold
+    none open.
+    """
+    timeout_ms = probe.timeout_ms or getattr(
+        settings, "DJANGO_DIAGNOSTIC_POSTGRESQL_STATEMENT_TIMEOUT_MS", 2000
+    )
+    outcome = {
+        "result": None,
+        "status": "ok",
+        "error": None,
+        "pgcode": None,
+        "elapsed_ms": None,
+    }
+    conn = connections[using]
+    started = time.perf_counter()
+    try:
+        with transaction.atomic(using=using), conn.cursor() as cursor:
+            if conn.vendor == "postgresql":
+                cursor.execute("SET LOCAL statement_timeout = %s", [timeout_ms])
+            outcome["result"] = probe.fetch(cursor, probe.sql)
+    except DatabaseError as e:
+        outcome["pgcode"] = getattr(e.__cause__, "pgcode", None)
+        if outcome["pgcode"] == QUERY_CANCELED:
+            outcome["status"] = "timeout"
+            outcome["error"] = f"timed out after {timeout_ms} ms"
+        else:
+            outcome["status"] = "error"
+            outcome["error"] = str(e)
+        module_logger.warning("Diagnostic probe %s failed: %s", probe.name, e)
+    finally:
+        outcome["elapsed_ms"] = round((time.perf_counter() - started) * 1000)
+        conn.close()
+
+    return outcome
+
+
+def get_probe_executor() -> ThreadPoolExecutor:
+    return get_executor(
+        "probes", getattr(settings, "DJANGO_DIAGNOSTIC_POSTGRESQL_PROBE_WORKERS", 4)
+    )
+
+
+def probe_snapshot_key(probe: Probe, using: str) -> str:
+    return f"django_diagnostic:probe:{using}:{probe.name}"
+
+
+def refresh_probe_snapshot(probe: Probe, using: str) -> dict[str, Any]:
+    """Run ``probe`` and, if it succeeded, store the outcome as its snapshot."""
+    outcome = run_probe(probe, using)
+    if outcome["status"] == "ok":
+        store_snapshot(
+            probe_snapshot_key(probe, using),
+            outcome,
+            getattr(settings, "DJANGO_DIAGNOSTIC_POSTGRESQL_SNAPSHOT_TTL", 300),
+            getattr(settings, "DJANGO_DIAGNOSTIC_POSTGRESQL_SNAPSHOT_STALE_TTL", 3600),
+        )
+    return outcome
+
+
+def get_probe_snapshot(probe: Probe, using: str) -> dict[str, Any] | None:
+    """
+    Cached outcome for a snapshot probe, or None when there is none. Within
+    ``DJANGO_DIAGNOSTIC_POSTGRESQL_SNAPSHOT_TTL`` seconds it is served as is;
+    after that, for up to ``DJANGO_DIAGNOSTIC_POSTGRESQL_SNAPSHOT_STALE_TTL``
+    more, it is served stale while it is refreshed in the background.
+    """
+    ttl = getattr(settings, "DJANGO_DIAGNOSTIC_POSTGRESQL_SNAPSHOT_TTL", 300)
+    snapshot = get_snapshot(
+        probe_snapshot_key(probe, using),
+        ttl,
+        partial(refresh_probe_snapshot, probe, using),
+        get_probe_executor(),
+    )
+    if snapshot is None:
+        return None
+
+    outcome, age = snapshot
+    return {**outcome, "snapshot_age": round(age), "stale": age >= ttl}
+
+
+def run_probes(
+    probes: Iterable[Probe],
+    using: str = DEFAULT_DB_ALIAS,
+    *,
+    refresh: bool = False,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Run ``probes`` concurrently, so the page costs the slowest probe rather
+    than the sum. Each probe is bounded server-side by its statement
+    timeout; ``DJANGO_DIAGNOSTIC_POSTGRESQL_PROBE_TIMEOUT`` seconds is the
+    overall backstop for probes stuck outside the database. Snapshot probes
+    are served from cache unless ``refresh`` is set. Returns the results by
+    probe name and, separately, each probe's status, error and elapsed
+    time, so failed sections can render alongside the rest.
+    """
+    timeout = getattr(settings, "DJANGO_DIAGNOSTIC_POSTGRESQL_PROBE_TIMEOUT", 5)
+
+    outcomes = {}
+    calls = {}
+    for probe in probes:
+        snapshot = None
+        if probe.snapshot and not refresh:
+            snapshot = get_probe_snapshot(probe, using)
+        if snapshot is not None:
+            outcomes[probe.name] = snapshot
+        elif probe.snapshot:
+            calls[probe.name] = partial(refresh_probe_snapshot, probe, using)
+        else:
+            calls[probe.name] = partial(run_probe, probe, using)
+
+    for name, outcome in run_bounded(calls, get_probe_executor(), timeout).items():
+        # a timed-out probe never got a server error code
+        outcomes[name] = {"pgcode": None, **outcome}
+
+    return split_outcomes(outcomes)
+
+
+# Probes behind the exported metrics; django_diagnostic.metrics refreshes
+# them in the background, so scrapes never run them inline.
+METRIC_PROBES = {
+    "connections": Probe(
+        "connections",
+        """
+        SELECT
+            COUNT(*) FILTER (WHERE state = 'active'),
+            COUNT(*) FILTER (WHERE state = 'idle'),
+            COUNT(*) FILTER (WHERE state = 'idle in transaction'),
+            COUNT(*)
+        FROM pg_stat_activity;
+        """,
+    ),
+    "blocked_locks": Probe(
+        "blocked_locks",
+        "SELECT COUNT(*) FROM pg_locks WHERE NOT granted;",
+        fetch_scalar,
+    ),
+    "database_size": Probe(
+        "database_size",
+        "SELECT pg_database_size(current_database());",
+        fetch_scalar,
+    ),
+}
+
+
+def run_metric_probe(name: str) -> Any:  # noqa: ANN401
+    """
+    Result of the metric probe ``name`` on the default database, or None
+    when that isn't PostgreSQL. Failures raise, so the metric keeps its
+    last good snapshot.
+    """
+    if connections[DEFAULT_DB_ALIAS].vendor != "postgresql":
+        return None
+    outcome = run_probe(METRIC_PROBES[name], DEFAULT_DB_ALIAS)
+    if outcome["status"] != "ok":
+        raise DatabaseError(outcome["error"])
+    return outcome["result"]
+
+
+def collect_connection_metrics() -> list[tuple[dict[str, str], int]]:
+    rows = run_metric_probe("connections")
+    if rows is None:
+        return []
+    active, idle, idle_in_transaction, total = rows[0]
+    return [
+        ({"state": "active"}, active),
+        ({"state": "idle"}, idle),
+        ({"state": "idle_in_transaction"}, idle_in_transaction),
+        ({"state": "other"}, total - active - idle - idle_in_transaction),
+    ]
+
+
+def collect_blocked_lock_metrics() -> list[tuple[dict[str, str], int]]:
+    blocked = run_metric_probe("blocked_locks")
+    return [] if blocked is None else [({}, blocked)]
+
+
+def collect_database_size_metrics() -> list[tuple[dict[str, str], int]]:
+    size = run_metric_probe("database_size")
+    return [] if size is None else [({}, size)]
+
+
+class DatabasePostgreSQLView(SuperuserRequiredMixin, TemplateView):
+    """
+    Basic information about postgresql database
+    """
+
+    page_title = _("PostgreSQL Diagnostic")
+    page_heading = _("PostgreSQL Diagnostic")
+    json_context_keys = (
+        "db_name",
+        "db_version",
+        "db_status",
+        *(probe.name for probe in POSTGRESQL_PROBES),
+        "db_probes",
+    )
+
+    def get_template_names(self) -> str:
+        return "django_diagnostic/database_postgresql.html"
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+
+        context["db_name"] = settings.DATABASES.get("default", {}).get(
+            "NAME", "<unknown>"
+        )
+
+        context["app_env"] = settings.APP_ENV
+        connection_info = collect_connection_info(connection)
+        context["db_connection_info"] = connection_info
+        context["db_version"] = connection_info["server_version"]
+        context["db_status"] = connection_info["status"]
+        context["db_dsn"] = connection_info["dsn"]
+
+        results, statuses = run_probes(
+            POSTGRESQL_PROBES, refresh=bool(self.request.GET.get("refresh"))
+        )
+        context.update(results)
+        context["db_probes"] = statuses
+
+        return context
+
+
+# Server-side ranking columns for the pg_stat_statements report, keyed by
+# the ?order= value. The timing columns were renamed in PostgreSQL 13.
+PG_STAT_STATEMENTS_ORDERINGS = {
+    "total": "total_time",
+    "mean": "mean_time",
+    "calls": "calls",
+    "rows": "rows",
+    "misses": "shared_blks_read",
+}
+
+
+def pg_stat_statements_probe(
+    server_version: int, order: str = "total", limit: int = 25
+) -> Probe:
+    """Top-N statements for the current database, ranked and limited in SQL."""
+    total = "total_exec_time" if server_version >= 130000 else "total_time"
+    mean = "mean_exec_time" if server_version >= 130000 else "mean_time"
+    order_by = PG_STAT_STATEMENTS_ORDERINGS.get(order, "total_time")
+    return Probe(
+        "pg_stat_statements",
+        f"""
+        SELECT queryid, calls,
+            {total} AS total_time,
+            {mean} AS mean_time,
+            rows,
+            shared_blks_hit,
+            shared_blks_read,
+            100.0 * shared_blks_hit
+                / NULLIF(shared_blks_hit + shared_blks_read, 0) AS hit_percent,
+            query
+        FROM pg_stat_statements
+        WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+        ORDER BY {order_by} DESC NULLS LAST
+        LIMIT {int(limit)};
+        """,  # noqa: S608 -- identifiers come from fixed whitelists, limit is an int
+    )
+
+
+class PgStatStatementsView(SuperuserRequiredMixin, TemplateView):
+    """
+    Historical hot queries from pg_stat_statements
+    """
+
+    page_title = _("PostgreSQL Top Queries")
+    page_heading = _("PostgreSQL Top Queries")
+    json_context_keys = (
+        "statements",
+        "statements_probe",
+        "unavailable",
+        "order",
+        "limit",
+    )
+
+    def get_template_names(self) -> str:
+        return "django_diagnostic/database_postgresql_statements.html"
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+
+        order = self.request.GET.get("order", "total")
+        if order not in PG_STAT_STATEMENTS_ORDERINGS:
+            order = "total"
+        try:
+            limit = min(max(int(self.request.GET.get("limit", 25)), 1), 500)
+        except ValueError:
+            limit = 25
+
+        server_version = 0
+        if connection.vendor == "postgresql":
+            server_version = collect_connection_info(connection)["server_version"]
+
+        results, statuses = run_probes(
+            [pg_stat_statements_probe(server_version, order, limit)]
+        )
+        status = statuses["pg_stat_statements"]
+
+        # An absent extension is an expected configuration, not a failure:
+        # report why the data is missing rather than the raw database error.
+        unavailable = None
+        if status["pgcode"] == UNDEFINED_TABLE:
+            unavailable = _(
+                "The pg_stat_statements extension is not installed in this "
+                "database (CREATE EXTENSION pg_stat_statements)."
+            )
+        elif status["pgcode"] == OBJECT_NOT_IN_PREREQUISITE_STATE:
+            unavailable = _(
+                "pg_stat_statements must be loaded via shared_preload_libraries."
+            )
+        elif status["status"] != "ok":
+            unavailable = status["error"]
+
+        context["statements"] = results["pg_stat_statements"] or []
+        context["statements_probe"] = status
+        context["unavailable"] = unavailable
+        context["order"] = order
+        context["orderings"] = list(PG_STAT_STATEMENTS_ORDERINGS)
+        context["limit"] = limit
+
+        return context
+
+
+INDEX_HEALTH_PROBES = (
+    Probe(
+        "unused_indexes",
+        """
+        SELECT s.schemaname, s.relname, s.indexrelname, s.idx_scan,
+            pg_relation_size(s.indexrelid) AS wasted_bytes,
+            pg_size_pretty(pg_relation_size(s.indexrelid)) AS wasted,
+            pg_get_indexdef(s.indexrelid) AS definition
+        FROM pg_stat_user_indexes s
+        JOIN pg_index i ON i.indexrelid = s.indexrelid
+        WHERE s.idx_scan = 0
+            AND NOT i.indisunique
+            AND NOT i.indisprimary
+            AND NOT EXISTS (
+                SELECT 1 FROM pg_constraint con WHERE con.conindid = s.indexrelid
+            )
+        ORDER BY wasted_bytes DESC
+        LIMIT 50;
+        """,
+    ),
+    # An index is redundant when another index on the same table, with the
+    # same access method, has the same key columns (exact) or starts with
+    # them (prefix) -- with the same operator classes, collations and
+    # ASC/DESC/NULLS options -- and also carries all its INCLUDE columns.
+    # Key columns are the first indnkeyatts of indkey; indclass, indcollation
+    # and indoption cover only those. Exact pairs are reported once, keeping
+    # the unique one; a unique prefix enforces its own constraint and is
+    # never redundant.
+    Probe(
+        "duplicate_indexes",
+        """
+        WITH idx AS (
+            SELECT i.indexrelid, i.indrelid, i.indisunique, i.indisprimary,
+                c.relname, c.relam,
+                string_to_array(i.indkey::text, ' ')::int2[] AS columns,
+                (string_to_array(i.indkey::text, ' ')::int2[])[1:i.indnkeyatts]
+                    AS keys,
+                string_to_array(i.indclass::text, ' ')::oid[] AS opclasses,
+                string_to_array(i.indcollation::text, ' ')::oid[] AS collations,
+                string_to_array(i.indoption::text, ' ')::int2[] AS options
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE i.indexprs IS NULL AND i.indpred IS NULL
+        )
+        SELECT n.nspname, t.relname, a.relname AS redundant_index,
+            b.relname AS covering_index,
+            CASE WHEN a.keys = b.keys THEN 'exact' ELSE 'prefix' END AS kind,
+            pg_relation_size(a.indexrelid) AS wasted_bytes,
+            pg_size_pretty(pg_relation_size(a.indexrelid)) AS wasted,
+            pg_get_indexdef(a.indexrelid) AS redundant_definition,
+            pg_get_indexdef(b.indexrelid) AS covering_definition
+        FROM idx a
+        JOIN idx b
+            ON b.indrelid = a.indrelid
+            AND b.indexrelid <> a.indexrelid
+            AND b.relam = a.relam
+        JOIN pg_class t ON t.oid = a.indrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE n.nspname NOT IN ('pg_catalog', 'information_schema')
+            AND NOT a.indisprimary
+            AND b.keys[1:cardinality(a.keys)] = a.keys
+            AND b.opclasses[1:cardinality(a.keys)] = a.opclasses
+            AND b.collations[1:cardinality(a.keys)] = a.collations
+            AND b.options[1:cardinality(a.keys)] = a.options
+            AND a.columns <@ b.columns
+            AND (
+                (a.keys <> b.keys AND NOT a.indisunique)
+                OR (
+                    a.keys = b.keys
+                    AND (
+                        (b.indisunique AND NOT a.indisunique)
+                        OR (
+                            a.indisunique = b.indisunique
+                            AND (
+                                NOT b.columns <@ a.columns
+                                OR a.indexrelid > b.indexrelid
+                            )
+                        )
+                    )
+                )
+            )
+        ORDER BY wasted_bytes DESC
+        LIMIT 50;
+        """,
+    ),
+    # Estimated btree bloat: compare actual pages with the pages the live
+    # tuples need, from planner statistics (reltuples, pg_stats.avg_width),
+    # 12 bytes of tuple header and line pointer per entry, and the default
+    # 90% leaf fillfactor. Cheap, but only as good as the last ANALYZE.
+    Probe(
+        "bloated_indexes",
+        """
+        WITH idx AS (
+            SELECT n.nspname, t.relname AS table_name, c.relname AS index_name,
+                c.relpages, c.reltuples,
+                current_setting('block_size')::numeric AS block_size,
+                (
+                    SELECT COALESCE(SUM(st.avg_width), 0)
+                    FROM pg_attribute att
+                    JOIN pg_stats st
+                        ON st.schemaname = n.nspname
+                        AND st.tablename = t.relname
+                        AND st.attname = att.attname
+                    WHERE att.attrelid = i.indrelid AND att.attnum = ANY(i.indkey)
+                ) AS data_width
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_class t ON t.oid = i.indrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_am am ON am.oid = c.relam AND am.amname = 'btree'
+            WHERE n.nspname NOT IN ('pg_catalog', 'information_schema')
+                AND c.relpages > 0
+                AND c.reltuples >= 0
+                AND i.indexprs IS NULL
+        ), estimate AS (
+            SELECT *,
+                CEIL(reltuples * (data_width + 12) / ((block_size - 24) * 0.9))
+                    AS expected_pages
+            FROM idx
+        )
+        SELECT nspname, table_name, index_name,
+            pg_size_pretty((relpages * block_size)::bigint) AS size,
+            (GREATEST(relpages - expected_pages, 0) * block_size)::bigint
+                AS wasted_bytes,
+            pg_size_pretty(
+                (GREATEST(relpages - expected_pages, 0) * block_size)::bigint
+            ) AS wasted,
+            -- expected_pages is float8, which has no two-argument ROUND
+            ROUND(
+                (100 * GREATEST(relpages - expected_pages, 0) / relpages)::numeric, 1
+            ) AS bloat_percent
+        FROM estimate
+        ORDER BY wasted_bytes DESC
+        LIMIT 50;
+        """,
+    ),
+)
+
+
+class IndexHealthView(SuperuserRequiredMixin, TemplateView):
+    """
+    Unused, duplicate and bloated indexes, by wasted bytes
+    """
+
+    page_title = _("PostgreSQL Index Health")
+    page_heading = _("PostgreSQL Index Health")
+    json_context_keys = (*(probe.name for probe in INDEX_HEALTH_PROBES), "db_probes")
+
+    def get_template_names(self) -> str:
+        return "django_diagnostic/database_postgresql_index_health.html"
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+
+        results, statuses = run_probes(INDEX_HEALTH_PROBES)
+        context.update(results)
+        context["db_probes"] = statuses
+
+        return context
+
+
+# Server-side orderings for the vacuum report, keyed by the ?sort= value.
+# Each sorts the worst tables first.
+TABLE_VACUUM_ORDERINGS = {
+    "dead_ratio": "dead_ratio DESC NULLS LAST",
+    "dead": "s.n_dead_tup DESC",
+    "bloat": "bloat_bytes DESC NULLS LAST",
+    "xid_age": "xid_age DESC NULLS LAST",
+    "last_autovacuum": "s.last_autovacuum ASC NULLS FIRST",
+    "last_autoanalyze": "s.last_autoanalyze ASC NULLS FIRST",
+}
+
+
+def table_vacuum_probe(
+    sort: str = "dead_ratio", limit: int = 50, offset: int = 0
+) -> Probe:
+    """
+    One page of pg_stat_user_tables, sorted and paginated in SQL. Bloat is
+    estimated from relpages and the dead tuple ratio rather than per-table
+    size functions, so the query stays cheap with thousands of tables.
+    """
+    order_by = TABLE_VACUUM_ORDERINGS.get(sort, TABLE_VACUUM_ORDERINGS["dead_ratio"])
+    return Probe(
+        "table_vacuum",
+        f"""
+        SELECT s.schemaname, s.relname, s.n_live_tup, s.n_dead_tup,
+            ROUND(
+                100.0 * s.n_dead_tup / NULLIF(s.n_live_tup + s.n_dead_tup, 0), 1
+            ) AS dead_ratio,
+            s.last_vacuum, s.last_autovacuum,
+            s.last_analyze, s.last_autoanalyze,
+            -- partitioned tables store no rows and have relfrozenxid 0,
+            -- which age() reports as 2^31 - 1
+            CASE WHEN c.relfrozenxid <> '0' THEN age(c.relfrozenxid) END
+                AS xid_age,
+            ROUND(
+                100.0
+                    * CASE WHEN c.relfrozenxid <> '0' THEN age(c.relfrozenxid) END
+                    / current_setting('autovacuum_freeze_max_age')::bigint,
+                1
+            ) AS xid_age_percent,
+            (
+                c.relpages::bigint * current_setting('block_size')::bigint
+                * s.n_dead_tup / NULLIF(s.n_live_tup + s.n_dead_tup, 0)
+            )::bigint AS bloat_bytes,
+            pg_size_pretty((
+                c.relpages::bigint * current_setting('block_size')::bigint
+                * s.n_dead_tup / NULLIF(s.n_live_tup + s.n_dead_tup, 0)
+            )::bigint) AS bloat,
+            s.n_dead_tup > current_setting('autovacuum_vacuum_threshold')::bigint
+                + current_setting('autovacuum_vacuum_scale_factor')::float8
+                * GREATEST(c.reltuples, 0) AS vacuum_overdue
+        FROM pg_stat_user_tables s
+        JOIN pg_class c ON c.oid = s.relid
+        ORDER BY {order_by}, s.relid
+        LIMIT {int(limit)} OFFSET {int(offset)};
+        """,  # noqa: S608 -- ORDER BY comes from a fixed whitelist, limit/offset are ints
+    )
+
+
+class TableVacuumView(SuperuserRequiredMixin, TemplateView):
+    """
+    Dead tuples, vacuum/analyze lag and wraparound age per table
+    """
+
+    page_title = _("PostgreSQL Vacuum & Bloat")
+    page_heading = _("PostgreSQL Vacuum & Bloat")
+    json_context_keys = (
+        "tables",
+        "db_probes",
+        "sort",
+        "page",
+        "previous_page",
+        "next_page",
+    )
+    page_size = 50
+
+    def get_template_names(self) -> str:
+        return "django_diagnostic/database_postgresql_vacuum.html"
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+
+        sort = self.request.GET.get("sort", "dead_ratio")
+        if sort not in TABLE_VACUUM_ORDERINGS:
+            sort = "dead_ratio"
+        try:
+            page = max(int(self.request.GET.get("page", 1)), 1)
+        except ValueError:
+            page = 1
+
+        # Fetch one row past the page to learn whether a next page exists.
+        results, statuses = run_probes(
+            [
+                table_vacuum_probe(
+                    sort, limit=self.page_size + 1, offset=(page - 1) * self.page_size
+                )
+            ]
+        )
+        tables = results["table_vacuum"] or []
+
+        context["tables"] = tables[: self.page_size]
+        context["db_probes"] = statuses
+        context["sort"] = sort
+        context["orderings"] = list(TABLE_VACUUM_ORDERINGS)
+        context["page"] = page
+        context["previous_page"] = page - 1 if page > 1 else None
+        context["next_page"] = page + 1 if len(tables) > self.page_size else None
+
+        return context
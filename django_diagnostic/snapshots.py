@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import BaseCache
+from django.db import connections
+
+module_logger = logging.getLogger(__name__)
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """
+    The process-lifetime thread pool ``name``, created with ``max_workers``
+    threads on first use. Each report gets its own, so a dependency that
+    stops answering parks only that report's threads.
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = _executors[name] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"diagnostic-{name}"
+            )
+    return executor
+
+
+def run_bounded(
+    calls: dict[str, Callable[[], dict[str, Any]]],
+    executor: ThreadPoolExecutor,
+    timeout: float,
+) -> dict[str, dict[str, Any]]:
+    """
+    Run ``calls`` concurrently on ``executor``, each returning an outcome
+    dict, and wait at most ``timeout`` seconds for them all. A call still
+    pending then is cancelled and given a "timeout" outcome, so a page costs
+    its slowest call, bounded, rather than the sum.
+    """
+    futures = {executor.submit(call): name for name, call in calls.items()}
+    _done, not_done = wait(futures, timeout=timeout)
+
+    outcomes = {}
+    for future, name in futures.items():
+        if future in not_done:
+            future.cancel()
+            outcomes[name] = {
+                "result": None,
+                "status": "timeout",
+                "error": f"timed out after {round(timeout * 1000)} ms",
+                "elapsed_ms": round(timeout * 1000),
+            }
+            module_logger.warning("Diagnostic call %s timed out", name)
+        else:
+            outcomes[name] = future.result()
+    return outcomes
+
+
+def split_outcomes(
+    outcomes: dict[str, dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Split outcomes into results and statuses (the rest of each outcome)."""
+    results = {}
+    statuses = {}
+    for name, outcome in outcomes.items():
+        statuses[name] = dict(outcome)
+        results[name] = statuses[name].pop("result")
+    return results, statuses
+
+
+def get_diagnostic_cache() -> BaseCache:
+    return caches[getattr(settings, "DJANGO_DIAGNOSTIC_CACHE", DEFAULT_CACHE_ALIAS)]
+
+
+def store_snapshot(key: str, value: Any, ttl: int, stale_ttl: int) -> None:  # noqa: ANN401
+    """Cache ``value`` as the snapshot ``key``, kept ``stale_ttl`` past its ``ttl``."""
+    get_diagnostic_cache().set(
+        key, {"value": value, "taken_at": time.time()}, ttl + stale_ttl
+    )
+
+
+def _background_refresh(key: str, refresh: Callable[[], Any]) -> None:
+    try:
+        refresh()
+    finally:
+        get_diagnostic_cache().delete(f"{key}:refreshing")
+        # connections are per-thread; don't leave this worker holding any
+        connections.close_all()
+
+
+def get_snapshot(
+    key: str,
+    ttl: int,
+    refresh: Callable[[], Any],
+    executor: ThreadPoolExecutor,
+    *,
+    refresh_missing: bool = False,
+) -> tuple[Any, float] | None:
+    """
+    The value of snapshot ``key`` and its age in seconds, or None when there
+    is none. Never refreshes inline: once the snapshot is ``ttl`` seconds
+    old -- or missing, with ``refresh_missing`` -- ``refresh`` is submitted
+    to ``executor``, at most once at a time across every worker behind a
+    cache.add lock, and the stale value is served until it lands.
+    """
+    cache = get_diagnostic_cache()
+    snapshot = cache.get(key)
+    age = time.time() - snapshot["taken_at"] if snapshot is not None else None
+
+    needs_refresh = refresh_missing if age is None else age >= ttl
+    # a 0 timeout expires at once, which would let every request refresh
+    if needs_refresh and cache.add(f"{key}:refreshing", 1, max(ttl, 1)):
+        executor.submit(_background_refresh, key, refresh)
+
+    if snapshot is None:
+        return None
+    return snapshot["value"], age
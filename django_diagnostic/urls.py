@@ -18,6 +18,7 @@ urlpatterns = [
     # Panels
     # Actions
     # APIs
+    path("metrics/", views.MetricsView.as_view(), name="metrics"),
     # Utils
     # Diagnostic
     # Deprecated
@@ -1,120 +1,93 @@
 import json
 import logging
+import math
 import os
 import pprint
-import re
+import random
 import socket
 import sys
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import UTC
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any
 
 import django
 from braces.views import SuperuserRequiredMixin
+from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.base import VALID_KEY_CHARS
 from django.contrib.sessions.models import Session
+from django.core.exceptions import PermissionDenied
 from django.core.validators import slug_re
-from django.db import connection
-from django.db.models import Case, Count, IntegerField, Max, Min, When
-from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDay
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.template.loader import render_to_string
+from django.template.response import SimpleTemplateResponse
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.crypto import constant_time_compare
+from django.utils.dateparse import parse_datetime
 from django.utils.module_loading import cached_import
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
-from django.views.generic import TemplateView
-from psycopg2.extensions import (
-    STATUS_BEGIN,
-    STATUS_IN_TRANSACTION,
-    STATUS_PREPARED,
-    STATUS_READY,
-)
+from django.views.generic import TemplateView, View
 
 from django_diagnostic import __version__
 from django_diagnostic.decorators import Diagnostic
+from django_diagnostic.encoders import get_json_encoder
+from django_diagnostic.masking import (
+    MASK,
+    QUERY_SECRET_KEYS,  # noqa: F401 -- re-exported
+    URL_PASSWORD_RE,
+    get_secret_masker,
+)
+from django_diagnostic.metrics import (
+    OPENMETRICS_CONTENT_TYPE,
+    collect_metrics,
+    render_openmetrics,
+)
 
 # GitPython is an optional extra (`django-diagnostic[git]`) -- the whole module
 # must stay importable without it, since GitCodeRunning degrades gracefully.
-HAS_GIT = False
-try:
-    from git import (  # ty: ignore[unresolved-import]
-        InvalidGitRepositoryError,
-        NoSuchPathError,
-        Repo,
-    )
-
-    HAS_GIT = True
-except ImportError:
-    pass
-
-HAS_TASK_RESULT = False
-try:
-    from django_celery_results.models import TaskResult  # ty: ignore[unresolved-import]
-
-    HAS_TASK_RESULT = True
-except ImportError:
-    pass
+# It is only imported once a page actually needs to read .git, which a
+# version manifest avoids altogether.
+HAS_GIT = find_spec("git") is not None
 
 module_logger = logging.getLogger(__name__)
 
 
-QUERY_SECRET_KEYS = {"SENTRY_KEY", "TOKEN", "API_KEY", "PASSWORD", "SECRET"}
-
-
 def mask_query_params(url: str) -> str:
-    if "?" not in url:
-        return url
-    base, query = url.split("?", 1)
-    parts = []
-    for pair in query.split("&"):
-        k, sep, v = pair.partition("=")
-        if k.upper() in QUERY_SECRET_KEYS:
-            v = "******"
-        parts.append(f"{k}{sep}{v}")
-    return f"{base}?{'&'.join(parts)}"
-
-
-# Match user:password@ in URLs
-URL_PASSWORD_RE = re.compile(r"([a-zA-Z][a-zA-Z0-9+.-]*:\/\/[^/:]+:)([^@]+)(@)")
+    return get_secret_masker().mask_query_params(url)
 
 
 def mask_url_string(url: str) -> str:
     # Replace password portion with ******
-    return URL_PASSWORD_RE.sub(r"\1******\3", url)
+    return URL_PASSWORD_RE.sub(rf"\1{MASK}\3", url)
 
 
 def mask_url(value: str) -> str:
-    value = mask_url_string(value)
-    return mask_query_params(value)
+    return get_secret_masker().mask_url(value)
 
 
 def mask_value(key: str, value: Any) -> Any:  # noqa: ANN401
-    SENSITIVE_KEYS = ["SECRET", "PASSWORD", "TOKEN", "HMAC", "KEY"]
-    WHITELISTED_KEYS = [
-        "PASSWORD_HASHERS",
-        "CHANGE_PASSWORD",
-        "RESET_PASSWORD",
-        "RESET_PASSWORD_FROM_KEY",
-    ]
-    if key.upper() in WHITELISTED_KEYS:
-        return value
-    if any(pat in key.upper() for pat in SENSITIVE_KEYS):
-        return "******"
-    return value
+    return MASK if get_secret_masker().is_sensitive_key(key) else value
 
 
 def mask_sensitive(key: str, value: Any) -> Any:  # noqa: ANN401
-    if isinstance(value, str):
-        if URL_PASSWORD_RE.search(value) or ("?" in value and "=" in value):
-            return mask_url(value)
-        return mask_value(key, value)
-
-    if isinstance(value, dict):
-        return {k: mask_sensitive(k, v) for k, v in value.items()}
-
-    if isinstance(value, list):
-        return [mask_sensitive(key, v) for v in value]
-
-    return value
+    return get_secret_masker().mask(key, value)
 
 
 class IndexView(SuperuserRequiredMixin, TemplateView):
@@ -129,37 +102,60 @@ class IndexView(SuperuserRequiredMixin, TemplateView):
         context["django_diagnostic_version"] = __version__
         registry_dict = {}
 
-        for registry_key, value in sorted(Diagnostic.registry.items()):
-            try:
-                my_klass = cached_import(value["module"], value["name"])
-            except (ImportError, AttributeError) as e:
+        index = Diagnostic.get_index()
+        for entry in index.entries:
+            resolved = index.resolve(entry)
+            if resolved.import_error:
                 module_logger.warning(
                     "Diagnostic registry entry %s failed to import: %s",
-                    registry_key,
-                    e,
+                    entry.registry_key,
+                    resolved.import_error,
                 )
                 continue
 
-            try:
-                link_name = value["kwargs"]["link_name"]
-            except KeyError:
+            if entry.link_name is None:
                 module_logger.warning(
                     "Diagnostic registry entry %s is missing link_name",
-                    registry_key,
+                    entry.registry_key,
                 )
                 continue
 
-            registry_dict[registry_key] = {
-                "doc": my_klass.__doc__,
-                "slug": value["slug"],
-                "app_name": value["app_name"],
-                "link_name": link_name,
+            registry_dict[entry.registry_key] = {
+                "doc": resolved.doc,
+                "slug": entry.slug,
+                "app_name": entry.app_name,
+                "link_name": entry.link_name,
             }
 
         context["registry"] = registry_dict
         return context
 
 
+def get_json_data(context: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    The JSON view of a report's context: its ``get_json_data(context)``, or
+    else the entries named by its ``json_context_keys`` allowlist. None for
+    reports that declare neither, which are only ever served as HTML.
+    """
+    view = context.get("view")
+    if hasattr(view, "get_json_data"):
+        return view.get_json_data(context)
+    keys = getattr(view, "json_context_keys", None)
+    if keys is None:
+        return None
+    return {key: context[key] for key in keys if key in context}
+
+
+def wants_json(request: HttpRequest) -> bool:
+    """``?format=json``, or an Accept header preferring JSON to HTML."""
+    if request.GET.get("format") == "json":
+        return True
+    return (
+        request.get_preferred_type(["text/html", "application/json"])
+        == "application/json"
+    )
+
+
 class DispatcherView(SuperuserRequiredMixin, TemplateView):
     def dispatch(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:  # noqa: ARG002
         slug = self.kwargs.get("slug", "")
@@ -168,20 +164,19 @@ class DispatcherView(SuperuserRequiredMixin, TemplateView):
         if not (slug_re.match(slug) and slug_re.match(app_name)):
             return HttpResponseRedirect(reverse("django_diagnostic:index"))
 
-        registry_key = Diagnostic.build_registry_key(app_name, slug)
         module_logger.debug(
-            "DIAGNOSTIC DISPATCHER retrieving entry with registry key: %s",
-            registry_key,
+            "DIAGNOSTIC DISPATCHER retrieving entry for %s/%s", app_name, slug
         )
 
-        try:
-            entry = Diagnostic.registry[registry_key]
-            my_klass = cached_import(entry["module"], entry["name"])
-        except (KeyError, ImportError, AttributeError) as e:
+        index = Diagnostic.get_index()
+        entry = index.lookup(app_name, slug)
+        view = index.get_view(entry) if entry is not None else None
+        if view is None:
             module_logger.warning(
-                "Diagnostic dispatcher could not resolve registry key %s: %s",
-                registry_key,
-                e,
+                "Diagnostic dispatcher could not resolve %s/%s: %s",
+                app_name,
+                slug,
+                index.resolve(entry).import_error if entry else "not registered",
             )
             return HttpResponseRedirect(reverse("django_diagnostic:index"))
 
@@ -191,7 +186,37 @@ class DispatcherView(SuperuserRequiredMixin, TemplateView):
         # any report that reads it. Errors raised by the report itself
         # are intentionally left to propagate to Django's normal
         # exception handling rather than being swallowed here.
-        return my_klass.as_view()(request)
+        response = view(request)
+
+        # Reports are TemplateViews whose responses render lazily, so a JSON
+        # client gets the context without the template ever being rendered.
+        # Only what each report allowlists is serialized; values are already
+        # masked by the reports that build them. A report without a JSON view
+        # answers a JSON client with 406 rather than an HTML page.
+        if wants_json(request):
+            data = None
+            if (
+                isinstance(response, SimpleTemplateResponse)
+                and not response.is_rendered
+            ):
+                data = get_json_data(response.context_data or {})
+            if data is not None:
+                response = JsonResponse(
+                    data,
+                    status=response.status_code,
+                    encoder=get_json_encoder(),
+                    json_dumps_params={"separators": (",", ":")},
+                )
+            elif response.status_code < 300 and response.get(
+                "Content-Type", ""
+            ).startswith("text/html"):
+                response = HttpResponse(
+                    _("This report has no JSON view."),
+                    status=406,
+                    content_type="text/plain; charset=utf-8",
+                )
+        patch_vary_headers(response, ["Accept"])
+        return response
 
 
 def _git_env_fallback_context() -> dict[str, Any]:
@@ -203,248 +228,228 @@ def _git_env_fallback_context() -> dict[str, Any]:
     }
 
 
-class GitCodeRunning:
-    def get_context_data(self, **kwargs) -> dict[str, Any]:
-        # Mixin is always combined with a Django View subclass that provides
-        # get_context_data via the MRO; ty can't infer that statically.
-        context = super().get_context_data(**kwargs)  # ty: ignore[unresolved-attribute]
-
-        if HAS_GIT:
-            try:
-                repo = Repo(search_parent_directories=True)
-                context["git_describe"] = repo.git.describe()
-                context["git_detached_head"] = repo.head.is_detached
-                if repo.head.is_detached is not True:
-                    context["git_active_branch"] = repo.active_branch.name
-                    context["active_branch_tracking_branch"] = (
-                        repo.active_branch.tracking_branch()
-                    )
-                    context["hexsha"] = repo.active_branch.object.hexsha
-                else:
-                    context["hexsha"] = repo.head.object.hexsha
-            except (InvalidGitRepositoryError, NoSuchPathError):
-                context.update(_git_env_fallback_context())
-        else:
-            context.update(_git_env_fallback_context())
-
-        context["django_version"] = django.VERSION
-        context["python_version"] = sys.version
-
+def git_head_key(git_dir: str, common_dir: str) -> tuple[float | None, ...]:
+    """
+    mtimes of ``HEAD``, the ref it points at and ``packed-refs``: a checkout
+    rewrites the first, a commit or reset on the branch the second, and
+    ``git pack-refs`` the third. Three ``stat`` calls, no subprocess.
+    """
+    head = Path(git_dir) / "HEAD"
+    paths = [head, Path(common_dir) / "packed-refs"]
+    try:
+        target = head.read_text().strip()
+    except OSError:
+        target = ""
+    if target.startswith("ref: "):
+        paths.append(Path(common_dir) / target.removeprefix("ref: "))
+
+    mtimes = []
+    for path in paths:
         try:
-            hostname = socket.gethostname()
+            mtimes.append(path.stat().st_mtime_ns)
         except OSError:
-            hostname = ""
+            mtimes.append(None)
+    return tuple(mtimes)
 
-        context["hostname"] = hostname
 
-        return context
+_git_metadata: dict[str, Any] = {}
+_git_metadata_lock = threading.Lock()
 
 
-# @Diagnostic.register(link_name='Celery', slug='celery')
-class CeleryView(SuperuserRequiredMixin, TemplateView):
+def read_git_metadata(repo: Any) -> dict[str, Any]:  # noqa: ANN401
     """
-    Celery system settings and controls
+    The running-code fields of ``repo``, a GitPython ``Repo``. ``--always``
+    falls back to the abbreviated commit on tagless and shallow clones,
+    where a bare ``git describe`` fails.
     """
+    metadata = {
+        "git_describe": repo.git.describe("--always"),
+        "git_detached_head": repo.head.is_detached,
+    }
+    if repo.head.is_detached is not True:
+        try:
+            tracking_branch = repo.active_branch.tracking_branch()
+        except (TypeError, ValueError):
+            # TypeError: HEAD detached since the check above; ValueError: a
+            # tracking ref configured but missing, as in many CI checkouts
+            tracking_branch = None
+        metadata["git_active_branch"] = repo.active_branch.name
+        metadata["active_branch_tracking_branch"] = (
+            str(tracking_branch) if tracking_branch else None
+        )
+        metadata["hexsha"] = repo.active_branch.object.hexsha
+    else:
+        metadata["hexsha"] = repo.head.object.hexsha
+    return metadata
 
-    page_title = _("Celery Diagnostic")
-    page_heading = _("Celery Diagnostic")
 
-    def get_template_names(self) -> str:
-        return "django_diagnostic/celery.html"
+def get_git_metadata() -> dict[str, Any]:
+    """
+    Git metadata for the running code, resolved once per process and again
+    only when ``git_head_key`` says HEAD has moved, so diagnostic pages
+    don't fork ``git describe`` on every request.
+    """
+    from git import (  # ty: ignore[unresolved-import]
+        InvalidGitRepositoryError,
+        NoSuchPathError,
+        Repo,
+    )
 
-    def get_context_data(self, **kwargs) -> dict[str, Any]:
-        return super().get_context_data(**kwargs)
+    with _git_metadata_lock:
+        if "git_dir" not in _git_metadata:
+            try:
+                repo = Repo(search_parent_directories=True)
+                _git_metadata["git_dir"] = repo.git_dir
+                _git_metadata["common_dir"] = repo.common_dir
+            except (InvalidGitRepositoryError, NoSuchPathError):
+                _git_metadata["git_dir"] = None
+        git_dir = _git_metadata["git_dir"]
+        if git_dir is None:
+            return _git_env_fallback_context()
 
+        key = git_head_key(git_dir, _git_metadata["common_dir"])
+        if _git_metadata.get("key") != key:
+            _git_metadata["context"] = read_git_metadata(Repo(git_dir))
+            _git_metadata["key"] = key
+        return _git_metadata["context"]
 
-@Diagnostic.register(link_name="Celery Results Summary", slug="celery-results-summary")
-class CeleryResultsSummary(SuperuserRequiredMixin, TemplateView):
+
+@lru_cache(maxsize=1)
+def read_version_manifest(path: str) -> dict[str, Any]:
     """
-    Summary of celery results from TaskResults table.
+    The manifest written by ``diagnostic_write_version_manifest``, read once
+    per process -- it describes the build, which doesn't change under a
+    running worker. Raises OSError or ValueError, which ``lru_cache`` does
+    not remember, so a manifest missing or half-written when the worker
+    started is picked up once it lands.
     """
+    with Path(path).open() as f:
+        manifest = json.load(f)
+    if not isinstance(manifest, dict):
+        raise ValueError("not a JSON object")
+    return manifest
+
+
+def load_version_manifest(path: str) -> dict[str, Any] | None:
+    """``read_version_manifest``, or ``None`` if it can't be read yet."""
+    try:
+        return read_version_manifest(path)
+    except (OSError, ValueError) as e:
+        module_logger.warning("Version manifest %s could not be read: %s", path, e)
+        return None
+
+
+def clear_git_metadata() -> None:
+    """Forget the cached repository, e.g. after the working directory moved."""
+    with _git_metadata_lock:
+        _git_metadata.clear()
+
+
+# What GitCodeRunning adds to a report's context, from a version manifest,
+# the repository or the environment fallback.
+GIT_JSON_CONTEXT_KEYS = (
+    "git_describe",
+    "git_detached_head",
+    "git_active_branch",
+    "active_branch_tracking_branch",
+    "hexsha",
+    "git_dirty",
+    "built_at",
+    "django_version",
+    "python_version",
+    "hostname",
+)
 
-    page_title = _("Celery Results Summary")
-    page_heading = _("Celery Results Summary")
 
-    def get_template_names(self) -> str:
-        return "django_diagnostic/celery_results_summary.html"
+class GitCodeRunning:
+    json_context_keys = GIT_JSON_CONTEXT_KEYS
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
-        context = super().get_context_data(**kwargs)
-        if settings.RESULTS_BACKEND == "django-db":
-            tasks = (
-                TaskResult.objects.values("task_name")
-                .annotate(total=Count("id"))
-                .annotate(earliest=Min("date_done"))
-                .annotate(latest=Max("date_done"))
-                .annotate(
-                    successes=Count(
-                        Case(
-                            When(status="SUCCESS", then=1),
-                            output_field=IntegerField(),
-                        )
-                    )
-                )
-                .annotate(
-                    failures=Count(
-                        Case(
-                            When(status="FAILURE", then=1),
-                            output_field=IntegerField(),
-                        )
-                    )
-                )
-                .order_by("task_name")
-            )
+        # Mixin is always combined with a Django View subclass that provides
+        # get_context_data via the MRO; ty can't infer that statically.
+        context = super().get_context_data(**kwargs)  # ty: ignore[unresolved-attribute]
 
-            context["tasks"] = tasks
-
-            totals = TaskResult.objects.aggregate(
-                total=Count("id"),
-                earliest=Min("date_done"),
-                latest=Max("date_done"),
-                successes=Count(
-                    Case(
-                        When(status="SUCCESS", then=1),
-                        output_field=IntegerField(),
-                    )
-                ),
-                failures=Count(
-                    Case(
-                        When(status="FAILURE", then=1),
-                        output_field=IntegerField(),
-                    )
-                ),
+        manifest_path = getattr(settings, "DJANGO_DIAGNOSTIC_VERSION_MANIFEST", None)
+        manifest = load_version_manifest(str(manifest_path)) if manifest_path else None
+        if manifest is not None:
+            # only the keys the manifest command writes: it's a file on disk,
+            # and mustn't be able to replace "view" or other context entries
+            context.update(
+                {key: manifest[key] for key in GIT_JSON_CONTEXT_KEYS if key in manifest}
             )
+        elif HAS_GIT:
+            context.update(get_git_metadata())
+        else:
+            context.update(_git_env_fallback_context())
 
-            context["totals"] = totals
-
-        return context
-
+        context["django_version"] = django.VERSION
+        context["python_version"] = sys.version
 
-def fetch_scalar(cursor: Any, sql: str) -> Any:  # noqa: ANN401
-    cursor.execute(sql)
-    return cursor.fetchone()[0]
+        try:
+            hostname = socket.gethostname()
+        except OSError:
+            hostname = ""
 
+        context["hostname"] = hostname
 
-def fetch_all(cursor: Any, sql: str) -> list[tuple]:  # noqa: ANN401
-    cursor.execute(sql)
-    return cursor.fetchall()
+        return context
 
 
-STATUS_MAP = {
-    STATUS_READY: "Ready",
-    STATUS_BEGIN: "Transaction started",
-    STATUS_PREPARED: "Prepared",
-    STATUS_IN_TRANSACTION: "In transaction",
+# Reports with optional or heavy dependencies (Celery, django-celery-results,
+# psycopg2) live in their own modules under django_diagnostic.reports and are
+# registered by path, so importing this module -- which urls.py does at
+# startup -- loads none of them until their report is dispatched.
+LAZY_REPORTS = {
+    "django_diagnostic.reports.celery_workers.CeleryView": {
+        "link_name": "Celery",
+        "slug": "celery",
+    },
+    "django_diagnostic.reports.celery_results.CeleryResultsSummary": {
+        "link_name": "Celery Results Summary",
+        "slug": "celery-results-summary",
+    },
+    "django_diagnostic.reports.postgresql.DatabasePostgreSQLView": {
+        "link_name": "Database PostgreSQL",
+        "slug": "database-postgresql",
+    },
+    "django_diagnostic.reports.postgresql.PgStatStatementsView": {
+        "link_name": "PostgreSQL Top Queries",
+        "slug": "database-postgresql-statements",
+    },
+    "django_diagnostic.reports.postgresql.IndexHealthView": {
+        "link_name": "PostgreSQL Index Health",
+        "slug": "database-postgresql-index-health",
+    },
+    "django_diagnostic.reports.postgresql.TableVacuumView": {
+        "link_name": "PostgreSQL Vacuum & Bloat",
+        "slug": "database-postgresql-vacuum",
+    },
 }
 
+for dotted_path, registration in LAZY_REPORTS.items():
+    Diagnostic.register_lazy(dotted_path, **registration)
 
-@Diagnostic.register(link_name="Database PostgreSQL", slug="database-postgresql")
-class DatabasePostgreSQLView(SuperuserRequiredMixin, TemplateView):
-    """
-    Basic information about postgresql database
-    """
-
-    page_title = _("PostgreSQL Diagnostic")
-    page_heading = _("PostgreSQL Diagnostic")
-
-    def get_template_names(self) -> str:
-        return "django_diagnostic/database_postgresql.html"
-
-    def get_context_data(self, **kwargs) -> dict[str, Any]:
-        context = super().get_context_data(**kwargs)
-
-        context["db_name"] = settings.DATABASES.get("default", {}).get(
-            "NAME", "<unknown>"
-        )
 
-        context["app_env"] = settings.APP_ENV
-        context["db_version"] = connection.cursor().connection.server_version
-        status_code = connection.cursor().connection.status
-        context["db_status"] = (
-            f"{STATUS_MAP.get(status_code, 'Unknown')} ({status_code})"
-        )
-        context["db_dsn"] = connection.cursor().connection.dsn
+# Public helpers that moved to django_diagnostic.reports with their reports.
+MOVED_ATTRIBUTES = {
+    "fetch_scalar": "django_diagnostic.reports.postgresql",
+    "fetch_all": "django_diagnostic.reports.postgresql",
+    "STATUS_MAP": "django_diagnostic.reports.postgresql",
+    "HAS_TASK_RESULT": "django_diagnostic.reports.celery_results",
+    "TaskResult": "django_diagnostic.reports.celery_results",
+}
 
-        with connection.cursor() as cursor:
-            context.update(
-                {
-                    "db_size": fetch_scalar(
-                        cursor,
-                        "SELECT pg_size_pretty(pg_database_size(current_database()));",
-                    ),
-                    "db_extensions": fetch_all(
-                        cursor,
-                        """
-                    SELECT extname, extversion, nspname
-                    FROM pg_extension
-                    JOIN pg_namespace
-                    ON pg_extension.extnamespace = pg_namespace.oid
-                    ORDER BY extname;
-                    """,
-                    ),
-                    "db_table_sizes": fetch_all(
-                        cursor,
-                        """
-                        SELECT *, pg_size_pretty(total_bytes) AS total,
-                        pg_size_pretty(index_bytes) AS INDEX,
-                        pg_size_pretty(toast_bytes) AS toast,
-                        pg_size_pretty(table_bytes) AS TABLE
-                        FROM (
-                            SELECT *,
-                                total_bytes - index_bytes - COALESCE(toast_bytes,0)
-                                AS table_bytes
-                            FROM (
-                                SELECT c.oid, nspname AS table_schema,
-                                    relname AS TABLE_NAME,
-                                    c.reltuples AS row_estimate,
-                                    pg_total_relation_size(c.oid) AS total_bytes,
-                                    pg_indexes_size(c.oid) AS index_bytes,
-                                    pg_total_relation_size(reltoastrelid) AS toast_bytes
-                                FROM pg_class c LEFT JOIN pg_namespace n
-                                    ON n.oid = c.relnamespace
-                                WHERE relkind = 'r'
-                            ) a
-                        ) a
-                        ORDER BY table_bytes DESC
-                        LIMIT 10;
-                        """,
-                    ),
-                    "db_checksums": fetch_scalar(cursor, "SHOW data_checksums;"),
-                    "db_connections": fetch_all(
-                        cursor,
-                        """
-                    SELECT
-                        COUNT(*) FILTER (WHERE state = 'active') AS active,
-                        COUNT(*) FILTER (WHERE state = 'idle') AS idle,
-                        COUNT(*) FILTER (WHERE state = 'idle in transaction')
-                          AS idle_in_tx,
-                        COUNT(*) AS total
-                    FROM pg_stat_activity;
-                    """,
-                    ),
-                    "db_long_queries": fetch_all(
-                        cursor,
-                        """
-                    SELECT pid, now() - query_start, state,
-                        wait_event_type, wait_event, query
-                    FROM pg_stat_activity
-                    WHERE state <> 'idle'
-                    ORDER BY query_start ASC
-                    LIMIT 10;
-                    """,
-                    ),
-                    "db_blocked_locks": fetch_all(
-                        cursor,
-                        """
-                    SELECT locktype, relation::regclass, mode
-                    FROM pg_locks
-                    WHERE NOT granted;
-                    """,
-                    ),
-                }
-            )
 
-        return context
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # Keep `from django_diagnostic.views import CeleryView` and friends
+    # working now that the reports live in django_diagnostic.reports.
+    for dotted_path in LAZY_REPORTS:
+        module, _dot, attr = dotted_path.rpartition(".")
+        if attr == name:
+            return cached_import(module, attr)
+    if name in MOVED_ATTRIBUTES:
+        return cached_import(MOVED_ATTRIBUTES[name], name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @Diagnostic.register(link_name="Debug", slug="debug")
@@ -475,6 +480,7 @@ class DemoView(SuperuserRequiredMixin, TemplateView):
 
     page_title = _("Demo Diagnostic")
     page_heading = _("Demo Diagnostic")
+    json_context_keys = ("demo",)
 
     def get_template_names(self) -> str:
         return "django_diagnostic/demo.html"
@@ -495,6 +501,7 @@ class DevopsView(SuperuserRequiredMixin, GitCodeRunning, TemplateView):
 
     page_title = _("DevOps Diagnostic")
     page_heading = _("DevOps Diagnostic")
+    json_context_keys = (*GIT_JSON_CONTEXT_KEYS, "environ")
 
     def get_template_names(self) -> str:
         return "django_diagnostic/devops.html"
@@ -502,7 +509,8 @@ class DevopsView(SuperuserRequiredMixin, GitCodeRunning, TemplateView):
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
 
-        context["environ"] = {k: mask_sensitive(k, v) for k, v in os.environ.items()}
+        masker = get_secret_masker()
+        context["environ"] = {k: masker.mask(k, v) for k, v in os.environ.items()}
         return context
 
 
@@ -514,6 +522,7 @@ class EnvironmentView(SuperuserRequiredMixin, GitCodeRunning, TemplateView):
 
     page_title = _("Environment Diagnostic")
     page_heading = _("Environment Diagnostic")
+    json_context_keys = (*GIT_JSON_CONTEXT_KEYS, "environ")
 
     def get_template_names(self) -> str:
         return "django_diagnostic/environment.html"
@@ -521,7 +530,8 @@ class EnvironmentView(SuperuserRequiredMixin, GitCodeRunning, TemplateView):
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
 
-        context["environ"] = {k: mask_sensitive(k, v) for k, v in os.environ.items()}
+        masker = get_secret_masker()
+        context["environ"] = {k: masker.mask(k, v) for k, v in os.environ.items()}
         return context
 
 
@@ -533,6 +543,7 @@ class ManifestView(SuperuserRequiredMixin, TemplateView):
 
     page_title = _("Whitenoise Static Manifest Diagnostic")
     page_heading = _("Whitenoise Static Manifest Diagnostic")
+    json_context_keys = ("staticfiles", "staticfiles_storage", "manifest", "error")
 
     def get_template_names(self) -> str:
         return "django_diagnostic/manifest.html"
@@ -569,6 +580,7 @@ class SettingsView(SuperuserRequiredMixin, GitCodeRunning, TemplateView):
 
     page_title = _("Settings Diagnostic")
     page_heading = _("Settings Diagnostic")
+    json_context_keys = (*GIT_JSON_CONTEXT_KEYS, "settings")
 
     def get_template_names(self) -> str:
         return "django_diagnostic/settings.html"
@@ -576,17 +588,308 @@ class SettingsView(SuperuserRequiredMixin, GitCodeRunning, TemplateView):
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
 
+        masker = get_secret_masker()
         context_settings = {}
         for key in dir(settings):
             if key.isupper():  # only real settings
                 val = getattr(settings, key)
-                val = mask_sensitive(key, val)
+                val = masker.mask(key, val)
                 context_settings[key] = val
 
         context["settings"] = context_settings
         return context
 
 
+# Marker rendered in place of the session rows when streaming, so the page
+# frame can be split into a head and tail around the streamed chunks.
+SESSIONS_STREAM_MARKER = mark_safe("<!-- django-diagnostic-sessions-stream -->")  # noqa: S308
+
+SESSION_SUMMARY_TOP_USERS = 20
+
+# The session row fields the sessions page shows, and so all its JSON
+# carries: never the auth hash or the session's own attributes.
+SESSION_JSON_FIELDS = (
+    "session_key",
+    "auth_user_id",
+    "username",
+    "full_name",
+    "auth_user_backend",
+    "expire_date",
+)
+
+
+def decode_session_row(
+    session_key: str,
+    expire_date: Any,  # noqa: ANN401
+    session_data: str,
+) -> dict[str, Any]:
+    """Decode one raw ``django_session`` row into the report's row dict."""
+    data = Session.get_session_store_class()().decode(session_data)
+
+    decoded_session = {"session_key": session_key, "expire_date": expire_date}
+    attributes = data.get("attributes")
+    if attributes:
+        decoded_session.update(attributes)
+    decoded_session["auth_user_id"] = data.get("_auth_user_id", None)
+    decoded_session["auth_user_backend"] = data.get("_auth_user_backend", None)
+    decoded_session["auth_user_hash"] = data.get("_auth_user_hash", None)
+    return decoded_session
+
+
+def attach_session_users(decoded_sessions: list[dict[str, Any]]) -> None:
+    """Resolve usernames for one batch of decoded sessions with a single query."""
+    uid_list = {
+        session_data["auth_user_id"]
+        for session_data in decoded_sessions
+        if session_data["auth_user_id"] is not None
+    }
+
+    users_by_id = {}
+    if uid_list:
+        UserModel = get_user_model()
+        users_by_id = {
+            str(user.pk): user for user in UserModel.objects.filter(pk__in=uid_list)
+        }
+
+    for session_data in decoded_sessions:
+        user = users_by_id.get(str(session_data["auth_user_id"]))
+        if user:
+            session_data["username"] = user.get_username()
+            session_data["full_name"] = user.get_full_name()
+        else:
+            session_data["username"] = None
+            session_data["full_name"] = None
+
+
+def encode_session_cursor(session_data: dict[str, Any]) -> str:
+    # Always UTC with a "Z" suffix: a "+00:00" offset would need escaping to
+    # survive a query string. Without USE_TZ the column holds naive values,
+    # written out unshifted and read back naive by decode_session_cursor.
+    expire_date = session_data["expire_date"]
+    if settings.USE_TZ:
+        expire_date = expire_date.astimezone(UTC)
+    else:
+        expire_date = timezone.make_aware(expire_date, UTC)
+    return f"{expire_date:%Y-%m-%dT%H:%M:%S.%fZ}_{session_data['session_key']}"
+
+
+def decode_session_cursor(cursor: str) -> tuple[Any, str] | None:
+    """Parse an ``expire_date``/``session_key`` keyset cursor, or None if invalid."""
+    expire_date, sep, session_key = cursor.rpartition("_")
+    if not sep:
+        return None
+    try:
+        parsed = parse_datetime(expire_date)
+    except ValueError:
+        return None
+    if parsed is None or timezone.is_naive(parsed):
+        return None
+    if not settings.USE_TZ:
+        parsed = timezone.make_naive(parsed, UTC)
+    return parsed, session_key
+
+
+def decode_session_rows(rows: list[tuple]) -> list[dict[str, Any]]:
+    return [decode_session_row(*row) for row in rows]
+
+
+def _init_session_decode_worker() -> None:
+    # Spawned (rather than forked) pool workers start without Django set up,
+    # and decoding needs settings for the session store class and signing key.
+    if not apps.ready:
+        django.setup()
+
+
+_session_decode_executors: dict[tuple[str, int | None], Executor] = {}
+_session_decode_executors_lock = threading.Lock()
+
+
+def get_session_decode_executor() -> Executor | None:
+    """
+    Process-lifetime pool for session decoding, as configured by
+    ``DJANGO_DIAGNOSTIC_SESSIONS_DECODE_EXECUTOR`` ("thread" or "process") and
+    ``DJANGO_DIAGNOSTIC_SESSIONS_DECODE_WORKERS``; None decodes serially.
+    """
+    mode = getattr(settings, "DJANGO_DIAGNOSTIC_SESSIONS_DECODE_EXECUTOR", None)
+    if mode not in ("thread", "process"):
+        return None
+    workers = getattr(settings, "DJANGO_DIAGNOSTIC_SESSIONS_DECODE_WORKERS", None)
+
+    with _session_decode_executors_lock:
+        executor = _session_decode_executors.get((mode, workers))
+        if executor is None:
+            if mode == "process":
+                executor = ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_session_decode_worker
+                )
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="diagnostic-sessions"
+                )
+            _session_decode_executors[(mode, workers)] = executor
+    return executor
+
+
+def decode_session_chunk(
+    rows: list[tuple], executor: Executor | None
+) -> list[dict[str, Any]]:
+    """
+    Decode a chunk of raw session rows, fanning batches out across
+    ``executor`` when one is configured. ``Executor.map`` yields results in
+    submission order, so the chunk keeps its ``expire_date`` ordering.
+    """
+    if executor is None:
+        return decode_session_rows(rows)
+
+    batch_size = getattr(settings, "DJANGO_DIAGNOSTIC_SESSIONS_DECODE_BATCH_SIZE", 250)
+    batches = [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
+    return [
+        decoded_session
+        for decoded_batch in executor.map(decode_session_rows, batches)
+        for decoded_session in decoded_batch
+    ]
+
+
+def iter_session_chunks(
+    after: tuple[Any, str] | None = None,
+    chunk_size: int = 500,
+    limit: int | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Walk the unexpired sessions in ``(expire_date, session_key)`` keyset order,
+    yielding decoded chunks of at most ``chunk_size`` rows with their users
+    attached. Memory stays bounded by the chunk, whatever the table size.
+    """
+    sessions = Session.objects.filter(expire_date__gte=timezone.now())
+    if after is not None:
+        expire_date, session_key = after
+        sessions = sessions.filter(
+            Q(expire_date__gt=expire_date)
+            | Q(expire_date=expire_date, session_key__gt=session_key)
+        )
+    rows = sessions.order_by("expire_date", "session_key").values_list(
+        "session_key", "expire_date", "session_data"
+    )
+    if limit is not None:
+        rows = rows[:limit]
+
+    executor = get_session_decode_executor()
+    batch = []
+    for row in rows.iterator(chunk_size=chunk_size):
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            chunk = decode_session_chunk(batch, executor)
+            attach_session_users(chunk)
+            yield chunk
+            batch = []
+
+    if batch:
+        chunk = decode_session_chunk(batch, executor)
+        attach_session_users(chunk)
+        yield chunk
+
+
+# Session keys are drawn uniformly from VALID_KEY_CHARS, so a contiguous
+# range of key prefixes is an unbiased random sample that the primary key
+# index can serve -- unlike ORDER BY RANDOM(), which sorts the whole table.
+SESSION_KEY_PREFIXES = [
+    a + b for a in sorted(VALID_KEY_CHARS) for b in sorted(VALID_KEY_CHARS)
+]
+
+
+def sample_session_key_range(sample_rate: float) -> Q:
+    """Filter selecting roughly ``sample_rate`` of sessions by key prefix."""
+    if sample_rate >= 1:
+        return Q()
+    width = max(1, math.ceil(sample_rate * len(SESSION_KEY_PREFIXES)))
+    start = random.randrange(len(SESSION_KEY_PREFIXES) - width + 1)  # noqa: S311
+    key_range = Q(session_key__gte=SESSION_KEY_PREFIXES[start])
+    if start + width < len(SESSION_KEY_PREFIXES):
+        key_range &= Q(session_key__lt=SESSION_KEY_PREFIXES[start + width])
+    return key_range
+
+
+def session_summary(sample_rate: float, sample_max: int) -> dict[str, Any]:
+    """
+    Session counts and expiry histogram from SQL aggregates, plus auth
+    breakdowns estimated from a decoded sample -- the payload is signed and
+    serialized, so those can't be read in SQL.
+    """
+    sessions = Session.objects.filter(expire_date__gte=timezone.now())
+    active = sessions.count()
+
+    expiry_histogram = list(
+        sessions.annotate(day=TruncDay("expire_date"))
+        .values("day")
+        .annotate(total=Count("session_key"))
+        .order_by("day")
+    )
+
+    sample = sessions.filter(sample_session_key_range(sample_rate)).values_list(
+        "session_key", "expire_date", "session_data"
+    )[:sample_max]
+
+    sample_size = 0
+    authenticated = 0
+    backends: dict[str, int] = {}
+    user_ids: dict[str, int] = {}
+    for row in sample.iterator(chunk_size=2000):
+        decoded_session = decode_session_row(*row)
+        sample_size += 1
+        if decoded_session["auth_user_id"] is None:
+            continue
+        authenticated += 1
+        backend = decoded_session["auth_user_backend"] or ""
+        backends[backend] = backends.get(backend, 0) + 1
+        user_id = str(decoded_session["auth_user_id"])
+        user_ids[user_id] = user_ids.get(user_id, 0) + 1
+
+    # Scale sample proportions to the exact active count rather than by the
+    # nominal rate, which stays accurate when sample_max truncates the sample.
+    scale = active / sample_size if sample_size else 0
+
+    top_users = sorted(user_ids.items(), key=lambda item: item[1], reverse=True)[
+        :SESSION_SUMMARY_TOP_USERS
+    ]
+    users_by_id = {}
+    if top_users:
+        UserModel = get_user_model()
+        users_by_id = {
+            str(user.pk): user
+            for user in UserModel.objects.filter(pk__in=[uid for uid, _n in top_users])
+        }
+
+    return {
+        "active": active,
+        "expiry_histogram": expiry_histogram,
+        "sample_size": sample_size,
+        "sample_rate": sample_rate,
+        "authenticated": round(authenticated * scale),
+        "anonymous": round((sample_size - authenticated) * scale),
+        "backends": sorted(
+            ((backend, round(count * scale)) for backend, count in backends.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        ),
+        "users": [
+            {
+                "user_id": user_id,
+                "username": (
+                    users_by_id[user_id].get_username()
+                    if user_id in users_by_id
+                    else None
+                ),
+                "sessions": round(count * scale),
+            }
+            for user_id, count in top_users
+        ],
+    }
+
+
+def collect_session_metrics() -> list[tuple[dict[str, str], int]]:
+    return [({}, Session.objects.filter(expire_date__gte=timezone.now()).count())]
+
+
 @Diagnostic.register(link_name="Sessions", slug="sessions")
 class SessionsView(SuperuserRequiredMixin, TemplateView):
     """
@@ -597,62 +900,115 @@ class SessionsView(SuperuserRequiredMixin, TemplateView):
     page_heading = _("Sessions Diagnostic")
 
     def get_template_names(self) -> str:
+        if self.request.GET.get("mode") == "summary":
+            return "django_diagnostic/sessions_summary.html"
         return "django_diagnostic/sessions.html"
 
+    def get_sample_rate(self) -> float:
+        """``?sample=`` capped at 1, or the setting when it isn't above 0."""
+        default = getattr(settings, "DJANGO_DIAGNOSTIC_SESSIONS_SAMPLE_RATE", 0.05)
+        try:
+            sample_rate = float(self.request.GET["sample"])
+        except (KeyError, ValueError):
+            return default
+        # float() accepts "nan" and "inf", which the key range can't size
+        if not math.isfinite(sample_rate) or sample_rate <= 0:
+            return default
+        return min(sample_rate, 1.0)
+
+    def get_sample_max(self) -> int:
+        return getattr(settings, "DJANGO_DIAGNOSTIC_SESSIONS_SAMPLE_MAX", 10000)
+
+    def get_page_size(self) -> int:
+        return getattr(settings, "DJANGO_DIAGNOSTIC_SESSIONS_PAGE_SIZE", 100)
+
+    def get_chunk_size(self) -> int:
+        return getattr(settings, "DJANGO_DIAGNOSTIC_SESSIONS_CHUNK_SIZE", 500)
+
+    def get_json_data(self, context: dict[str, Any]) -> dict[str, Any]:
+        if "summary" in context:
+            return {"summary": context["summary"]}
+        return {
+            "sessions": [
+                {field: session_data.get(field) for field in SESSION_JSON_FIELDS}
+                for session_data in context.get("decoded_sessions", {}).values()
+            ],
+            "page_size": context["page_size"],
+            "next_cursor": context.get("next_cursor"),
+        }
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if request.GET.get("stream"):
+            return StreamingHttpResponse(self.stream_sessions())
+        return super().get(request, *args, **kwargs)
+
+    def stream_sessions(self) -> Iterator[str]:
+        """
+        Render the page frame once, then stream the session rows into it chunk
+        by chunk, so the first rows reach the browser before the whole table
+        has been decoded.
+        """
+        context = self.get_context_data(streaming=True)
+        frame = render_to_string(self.get_template_names(), context, self.request)
+        head, _marker, tail = frame.partition(SESSIONS_STREAM_MARKER)
+        yield head
+
+        empty = True
+        for chunk in iter_session_chunks(chunk_size=self.get_chunk_size()):
+            empty = False
+            yield render_to_string(
+                "django_diagnostic/sessions_rows.html",
+                {"sessions": chunk},
+                self.request,
+            )
+
+        if empty:
+            yield render_to_string(
+                "django_diagnostic/sessions_rows.html", {"sessions": []}, self.request
+            )
+        yield tail
+
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
+        context["stream_marker"] = SESSIONS_STREAM_MARKER
+        page_size = self.get_page_size()
+        context["page_size"] = page_size
+
+        if context.get("streaming"):
+            return context
 
-        sessions = Session.objects.filter(expire_date__gte=timezone.now())
-        # context["sessions"] = sessions.values_list(
-        #     "session_key", "expire_date"
-        # ).order_by("-expire_date")
-
-        decoded_sessions = {}
-        uid_list = []
-        for session in sessions:
-            decoded_session = {}
-            decoded_session["session_key"] = session.session_key
-            decoded_session["expire_date"] = session.expire_date
-            data = session.get_decoded()
-            attributes = data.get("attributes")
-            if attributes:
-                for key, value in attributes.items():
-                    decoded_session[key] = value
-            decoded_session["auth_user_id"] = data.get("_auth_user_id", None)
-            decoded_session["auth_user_backend"] = data.get("_auth_user_backend", None)
-            decoded_session["auth_user_hash"] = data.get("_auth_user_hash", None)
-            module_logger.debug(
-                "DIAGNOSTIC REGISTER adding decoded session to context: %s",
-                decoded_session,
+        if self.request.GET.get("mode") == "summary":
+            context["summary"] = session_summary(
+                self.get_sample_rate(), self.get_sample_max()
             )
+            return context
 
-            decoded_sessions[session.session_key] = decoded_session
+        after = decode_session_cursor(self.request.GET.get("after", ""))
 
-            # also build a list of user ids from that query
-            uid_list.append(data.get("_auth_user_id", None))
+        # Fetch one row past the page to learn whether a next page exists,
+        # without a separate COUNT(*) over the whole table.
+        decoded_sessions = []
+        for chunk in iter_session_chunks(
+            after=after, chunk_size=self.get_chunk_size(), limit=page_size + 1
+        ):
+            decoded_sessions.extend(chunk)
 
-        context["decoded_sessions"] = decoded_sessions
+        has_next = len(decoded_sessions) > page_size
+        decoded_sessions = decoded_sessions[:page_size]
+
+        context["decoded_sessions"] = {
+            session_data["session_key"]: session_data
+            for session_data in decoded_sessions
+        }
+        context["is_first_page"] = after is None
+        context["next_cursor"] = (
+            encode_session_cursor(decoded_sessions[-1]) if has_next else None
+        )
         module_logger.debug(
             "DIAGNOSTIC REGISTER decoded sessions context: %s",
             context["decoded_sessions"],
         )
 
-        # Query all logged in users based on id list
-        UserModel = get_user_model()
-        users_by_id = {
-            str(user.id): user for user in UserModel.objects.filter(id__in=uid_list)
-        }
-
-        for _session_key, session_data in decoded_sessions.items():
-            user_id = str(session_data["auth_user_id"])
-            user = users_by_id.get(user_id)
-            if user:
-                session_data["username"] = user.get_username()
-                session_data["full_name"] = user.get_full_name()
-            else:
-                session_data["username"] = None
-                session_data["full_name"] = None
-
         return context
 
 
@@ -667,6 +1023,13 @@ class RegistryDiagnosticView(SuperuserRequiredMixin, TemplateView):
 
     page_title = _("Diagnostic Reports Registry")
     page_heading = _("Diagnostic Reports Registry")
+    json_context_keys = (
+        "entries",
+        "registry_count",
+        "failed_count",
+        "discovered",
+        "discovered_ms",
+    )
 
     def get_template_names(self) -> str:
         return "django_diagnostic/registry.html"
@@ -675,27 +1038,58 @@ class RegistryDiagnosticView(SuperuserRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
 
         entries = []
-        for registry_key, value in sorted(Diagnostic.registry.items()):
-            entry = {
-                "registry_key": registry_key,
-                "app_name": value.get("app_name"),
-                "slug": value.get("slug"),
-                "module": value.get("module"),
-                "name": value.get("name"),
-                "link_name": value.get("kwargs", {}).get("link_name"),
-                "doc": None,
-                "import_error": None,
-            }
-            try:
-                my_klass = cached_import(value["module"], value["name"])
-                entry["doc"] = my_klass.__doc__
-            except (ImportError, AttributeError) as e:
-                entry["import_error"] = str(e)
-
-            entries.append(entry)
+        index = Diagnostic.get_index()
+        for entry in index.entries:
+            resolved = index.resolve(entry)
+            entries.append(
+                {
+                    "registry_key": entry.registry_key,
+                    "app_name": entry.app_name,
+                    "slug": entry.slug,
+                    "module": entry.module,
+                    "name": entry.name,
+                    "link_name": entry.link_name,
+                    "doc": resolved.doc,
+                    "import_error": resolved.import_error,
+                }
+            )
 
         context["entries"] = entries
         context["registry_count"] = len(entries)
         context["failed_count"] = sum(1 for entry in entries if entry["import_error"])
+        # slowest first: these imports run in every worker at startup
+        context["discovered"] = sorted(
+            Diagnostic.discovered or (), key=lambda d: d["elapsed_ms"], reverse=True
+        )
+        context["discovered_ms"] = round(
+            sum(d["elapsed_ms"] for d in context["discovered"]), 1
+        )
 
         return context
+
+
+class MetricsView(View):
+    """
+    OpenMetrics exposition of the diagnostic metrics, for scrapers. Served
+    from the collector's cached snapshots, so a scrape costs a few cache
+    reads. Open to superusers, and to requests carrying
+    ``Authorization: Bearer <DJANGO_DIAGNOSTIC_METRICS_TOKEN>``.
+    """
+
+    def has_access(self, request: HttpRequest) -> bool:
+        token = getattr(settings, "DJANGO_DIAGNOSTIC_METRICS_TOKEN", None)
+        scheme, _sep, credentials = request.headers.get("Authorization", "").partition(
+            " "
+        )
+        if token and scheme.lower() == "bearer":
+            return constant_time_compare(credentials.strip(), token)
+        user = getattr(request, "user", None)
+        return bool(user and user.is_superuser)
+
+    def get(self, request: HttpRequest, *_args, **_kwargs) -> HttpResponse:
+        if not self.has_access(request):
+            raise PermissionDenied
+        return HttpResponse(
+            render_openmetrics(collect_metrics()),
+            content_type=OPENMETRICS_CONTENT_TYPE,
+        )
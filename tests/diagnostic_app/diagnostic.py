@@ -0,0 +1,13 @@
+from braces.views import SuperuserRequiredMixin
+from django.http import HttpRequest, HttpResponse
+from django.views.generic import View
+
+from django_diagnostic.decorators import Diagnostic
+
+
+@Diagnostic.register(link_name="Autodiscovered", slug="autodiscovered")
+class AutodiscoveredDiagnosticView(SuperuserRequiredMixin, View):
+    """Host-app report registered only by autodiscovery."""
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:  # noqa: ARG002
+        return HttpResponse("autodiscovered")
@@ -1,3 +1,4 @@
+from importlib.util import find_spec
 from pathlib import Path
 
 DEBUG = True
@@ -23,8 +24,17 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.sites",
     "django_diagnostic",
+    # host app with a diagnostic module, picked up by autodiscovery
+    "tests.diagnostic_app",
 ]
 
+# django-celery-results is an optional extra; its report tests are skipped
+# when it isn't installed.
+if find_spec("django_celery_results"):
+    INSTALLED_APPS.append("django_celery_results")
+
+RESULTS_BACKEND = "django-db"
+
 SITE_ID = 1
 
 MIDDLEWARE = ()
@@ -0,0 +1,240 @@
+import unittest
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from django_diagnostic.models import TaskResultRollup
+from django_diagnostic.reports.celery_results import (
+    HAS_TASK_RESULT,
+    CeleryResultsSummary,
+    percentile_cont,
+    task_result_histogram,
+)
+
+if HAS_TASK_RESULT:
+    from django_celery_results.models import TaskResult
+
+UserModel = get_user_model()
+
+
+@unittest.skipUnless(HAS_TASK_RESULT, "django-celery-results is not installed")
+class CeleryResultsSummaryTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.superuser = UserModel.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="password",  # noqa: S106 -- throwaway test fixture, not a real credential
+        )
+        self.now = timezone.now()
+
+    def _task_result(
+        self,
+        task_name: str,
+        status: str,
+        age: timedelta,
+        runtime: timedelta = timedelta(0),
+    ) -> None:
+        result = TaskResult.objects.create(
+            task_id=f"{task_name}-{TaskResult.objects.count()}",
+            task_name=task_name,
+            status=status,
+        )
+        # date_created/date_done are auto_now(_add), so backdate with an update
+        TaskResult.objects.filter(pk=result.pk).update(
+            date_created=self.now - age - runtime, date_done=self.now - age
+        )
+
+    def _render(self, query: str = "") -> dict:
+        request = self.factory.get(f"/django_diagnostic/celery-results-summary/{query}")
+        request.user = self.superuser
+        view = CeleryResultsSummary()
+        view.setup(request)
+        return view.get_context_data()
+
+    def test_rollups_are_updated_incrementally_from_the_high_water_mark(self) -> None:
+        self._task_result("tasks.a", "SUCCESS", timedelta(hours=3))
+        self._task_result("tasks.a", "FAILURE", timedelta(hours=2))
+        self._task_result("tasks.b", "SUCCESS", timedelta(hours=2))
+        TaskResultRollup.objects.update_from_task_results()
+
+        context = self._render()
+        tasks = {task["task_name"]: task for task in context["tasks"]}
+        self.assertEqual(tasks["tasks.a"]["total"], 2)
+        self.assertEqual(tasks["tasks.a"]["failures"], 1)
+        self.assertEqual(context["totals"]["total"], 3)
+
+        self._task_result("tasks.b", "FAILURE", timedelta(seconds=30))
+        # the catch-up only reads rows past the mark
+        self.assertEqual(
+            TaskResultRollup.objects.update_from_task_results(
+                now=self.now + timedelta(minutes=5)
+            ),
+            1,
+        )
+
+        context = self._render()
+        tasks = {task["task_name"]: task for task in context["tasks"]}
+        self.assertEqual(tasks["tasks.b"]["total"], 2)
+        self.assertEqual(context["totals"]["successes"], 2)
+        self.assertEqual(context["totals"]["failures"], 2)
+
+    def test_unsettled_results_wait_for_the_next_run(self) -> None:
+        self._task_result("tasks.a", "SUCCESS", timedelta(hours=1))
+        self._task_result("tasks.a", "SUCCESS", timedelta(seconds=5))
+        TaskResultRollup.objects.update_from_task_results()
+
+        self.assertEqual(self._render()["totals"]["total"], 1)
+
+    def test_page_view_does_not_roll_up_by_default(self) -> None:
+        self._task_result("tasks.a", "SUCCESS", timedelta(hours=1))
+
+        request = self.factory.get("/")
+        request.user = self.superuser
+        response = CeleryResultsSummary.as_view()(request)
+
+        self.assertContains(response, "diagnostic_rollup_celery_results")
+        self.assertFalse(TaskResultRollup.objects.exists())
+
+    @override_settings(
+        DJANGO_DIAGNOSTIC_CELERY_ROLLUP_ON_VIEW=True,
+        DJANGO_DIAGNOSTIC_CELERY_ROLLUP_WINDOW_HOURS=1,
+    )
+    def test_on_view_rollup_folds_one_window_per_request(self) -> None:
+        self._task_result("tasks.a", "SUCCESS", timedelta(hours=5))
+        self._task_result("tasks.a", "SUCCESS", timedelta(hours=1))
+
+        self.assertEqual(self._render()["totals"]["total"], 1)
+
+        request = self.factory.get("/")
+        request.user = self.superuser
+        response = CeleryResultsSummary.as_view()(request)
+        # the second window was empty; the lag is shown rather than caught up
+        self.assertEqual(response.context_data["totals"]["total"], 1)
+        self.assertContains(response, "hours behind")
+
+    def test_management_command_updates_rollups(self) -> None:
+        self._task_result("tasks.a", "SUCCESS", timedelta(hours=1))
+
+        call_command("diagnostic_rollup_celery_results", verbosity=0)
+
+        self.assertEqual(TaskResultRollup.objects.get().total, 1)
+
+    def test_window_filters_in_sql_and_buckets_counts(self) -> None:
+        self._task_result("tasks.a", "SUCCESS", timedelta(minutes=5))
+        self._task_result("tasks.a", "FAILURE", timedelta(minutes=5))
+        self._task_result("tasks.a", "SUCCESS", timedelta(hours=2))
+
+        context = self._render("?window=1h")
+
+        self.assertEqual(context["window"], "1h")
+        self.assertEqual(context["totals"]["total"], 2)
+        self.assertEqual(len(context["buckets"]), 61)
+        counts = context["histogram"]["tasks.a"]
+        self.assertEqual(sum(c["successes"] for c in counts), 1)
+        self.assertEqual(sum(c["failures"] for c in counts), 1)
+
+        request = self.factory.get("/?window=1h")
+        request.user = self.superuser
+        response = CeleryResultsSummary.as_view()(request)
+        self.assertContains(response, "Successes / Failures per Bucket")
+
+    def test_histogram_is_a_single_query(self) -> None:
+        self._task_result("tasks.a", "SUCCESS", timedelta(hours=3))
+        self._task_result("tasks.b", "SUCCESS", timedelta(hours=5))
+        now = timezone.now()
+
+        with self.assertNumQueries(1):
+            buckets, histogram = task_result_histogram(
+                now - timedelta(hours=24), "hour", now
+            )
+
+        self.assertEqual(set(histogram), {"tasks.a", "tasks.b"})
+        self.assertTrue(all(len(c) == len(buckets) for c in histogram.values()))
+
+    def test_window_summary_reads_the_table_once_for_rows_and_totals(self) -> None:
+        for i in range(20):
+            self._task_result(
+                f"tasks.{i % 4}",
+                "FAILURE" if i % 5 == 0 else "SUCCESS",
+                timedelta(minutes=i),
+            )
+
+        # grouped rows (totals folded from them), runtime sample, histogram
+        with self.assertNumQueries(3):
+            context = self._render("?window=1h")
+
+        self.assertEqual(len(context["tasks"]), 4)
+        self.assertEqual(
+            context["totals"],
+            {
+                "total": 20,
+                "successes": 16,
+                "failures": 4,
+                "earliest": self.now - timedelta(minutes=19),
+                "latest": self.now,
+            },
+        )
+
+    def test_rollup_summary_derives_totals_from_the_grouped_rows(self) -> None:
+        self._task_result("tasks.a", "SUCCESS", timedelta(hours=3))
+        self._task_result("tasks.b", "FAILURE", timedelta(hours=2))
+        TaskResultRollup.objects.update_from_task_results()
+
+        # grouped rollups and the high-water mark
+        with self.assertNumQueries(2):
+            context = self._render()
+
+        self.assertEqual(context["totals"]["total"], 2)
+        self.assertEqual(context["totals"]["failures"], 1)
+        self.assertEqual(context["totals"]["earliest"], self.now - timedelta(hours=3))
+
+    def test_unknown_window_falls_back_to_rollups(self) -> None:
+        self.assertEqual(self._render("?window=bogus")["window"], "all")
+
+    def test_runtime_percentiles_sort_by_tail_latency(self) -> None:
+        for seconds in range(1, 101):
+            self._task_result(
+                "tasks.fast", "SUCCESS", timedelta(minutes=1), timedelta(seconds=1)
+            )
+            self._task_result(
+                "tasks.tail",
+                "SUCCESS",
+                timedelta(minutes=1),
+                timedelta(seconds=seconds),
+            )
+
+        context = self._render("?window=15m&sort=p99")
+        tasks = list(context["tasks"])
+
+        self.assertEqual(
+            [task["task_name"] for task in tasks], ["tasks.tail", "tasks.fast"]
+        )
+        self.assertAlmostEqual(tasks[0]["p50"], 50.5)
+        self.assertAlmostEqual(tasks[0]["p99"], 99.01)
+        self.assertAlmostEqual(tasks[1]["p99"], 1.0)
+
+    def test_full_history_refuses_the_latency_sort_visibly(self) -> None:
+        context = self._render("?sort=p99")
+        self.assertEqual(context["window"], "all")
+        self.assertEqual(context["sort"], "task_name")
+        self.assertEqual(context["sort_unavailable"], "p99")
+
+        request = self.factory.get(
+            "/django_diagnostic/celery-results-summary/?sort=p99"
+        )
+        request.user = self.superuser
+        response = CeleryResultsSummary.as_view()(request)
+        self.assertContains(response, "can't be sorted by p99")
+        self.assertContains(response, 'href="?window=1h&amp;sort=p99"')
+
+
+class PercentileContTests(SimpleTestCase):
+    def test_matches_postgresql_linear_interpolation(self) -> None:
+        self.assertIsNone(percentile_cont([], 0.5))
+        self.assertEqual(percentile_cont([3.0], 0.99), 3.0)
+        self.assertEqual(percentile_cont([4.0, 1.0, 3.0, 2.0], 0.5), 2.5)
+        self.assertAlmostEqual(percentile_cont([1.0, 2.0, 3.0, 4.0], 0.95), 3.85)
@@ -0,0 +1,140 @@
+import threading
+import time
+import unittest
+from typing import Any
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase, override_settings
+
+from django_diagnostic.reports.celery_workers import HAS_CELERY, CeleryView
+
+if HAS_CELERY:
+    from celery import Celery
+    from kombu import Connection, Queue
+
+    # An in-memory broker: passive queue_declare answers from kombu's
+    # in-process queues, with no server and no worker.
+    app = Celery("diagnostic_tests", broker="memory://", set_as_current=False)
+    app.conf.task_queues = [Queue("celery"), Queue("priority")]
+
+UserModel = get_user_model()
+
+WORKER = "celery@worker-1"
+
+release_hung_worker = threading.Event()
+
+
+class StandInInspect:
+    """Replies as a single worker would, except ``scheduled`` never returns."""
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+
+    def stats(self) -> dict[str, Any]:
+        return {WORKER: {"pool": {"implementation": "solo"}, "uptime": 42}}
+
+    def active(self) -> dict[str, Any]:
+        return {WORKER: [{"id": "abc", "name": "tasks.add", "args": [1, 2]}]}
+
+    def reserved(self) -> dict[str, Any]:
+        return {WORKER: []}
+
+    def scheduled(self) -> dict[str, Any]:
+        release_hung_worker.wait(timeout=10)
+        return {WORKER: []}
+
+    def active_queues(self) -> dict[str, Any]:
+        return {WORKER: [{"name": "celery"}, {"name": "priority"}]}
+
+
+class StandInControl:
+    def inspect(self, timeout: float) -> StandInInspect:
+        return StandInInspect(timeout)
+
+
+@unittest.skipUnless(HAS_CELERY, "celery is not installed")
+@override_settings(
+    DJANGO_DIAGNOSTIC_CELERY_APP="tests.test_celery_view.app",
+    DJANGO_DIAGNOSTIC_CELERY_INSPECT_TIMEOUT=0.1,
+)
+class CeleryViewTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.superuser = UserModel.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="password",  # noqa: S106 -- throwaway test fixture, not a real credential
+        )
+        app.control = StandInControl()
+        release_hung_worker.clear()
+        self.addCleanup(release_hung_worker.set)
+
+        with app.connection_for_write() as conn:
+            conn.default_channel.queue_declare(queue="celery")
+            conn.default_channel.queue_purge(queue="celery")
+            for i in range(3):
+                conn.default_channel.basic_publish(
+                    conn.default_channel.prepare_message(str(i)),
+                    exchange="",
+                    routing_key="celery",
+                )
+
+    def _render(self) -> dict:
+        request = self.factory.get("/django_diagnostic/celery/")
+        request.user = self.superuser
+        view = CeleryView()
+        view.setup(request)
+        return view.get_context_data()
+
+    def test_hung_inspect_call_is_bounded_by_the_reply_timeout(self) -> None:
+        started = time.perf_counter()
+        context = self._render()
+
+        # reply timeout plus one second of grace, not the hung call's 10 s
+        self.assertLess(time.perf_counter() - started, 2)
+        self.assertEqual(context["probes"]["scheduled"]["status"], "timeout")
+        self.assertEqual(context["probes"]["active"]["status"], "ok")
+
+        (worker,) = context["workers"]
+        self.assertEqual(worker["name"], WORKER)
+        self.assertEqual(worker["active"][0]["name"], "tasks.add")
+        self.assertEqual(worker["scheduled"], [])
+        self.assertEqual(worker["queues"], ["celery", "priority"])
+
+    def test_queue_depths_come_from_a_passive_declare(self) -> None:
+        depths = self._render()["queue_depths"]
+
+        self.assertEqual(depths["celery"]["messages"], 3)
+        # a passive declare reports the missing queue instead of creating it
+        self.assertIsNone(depths["priority"]["messages"])
+        self.assertTrue(depths["priority"]["error"])
+
+    def test_page_renders_workers_and_queues(self) -> None:
+        request = self.factory.get("/django_diagnostic/celery/")
+        request.user = self.superuser
+        response = CeleryView.as_view()(request)
+
+        self.assertContains(response, WORKER)
+        self.assertContains(response, "tasks.add")
+        self.assertContains(response, "memory://")
+
+    def test_broker_connections_are_released(self) -> None:
+        opened = []
+        connection_for_read = app.connection_for_read
+
+        def tracked_connection_for_read() -> Any:  # noqa: ANN401
+            opened.append(connection_for_read())
+            return opened[-1]
+
+        with (
+            mock.patch.object(app, "connection_for_read", tracked_connection_for_read),
+            mock.patch.object(
+                Connection, "release", autospec=True, side_effect=Connection.release
+            ) as release,
+        ):
+            self._render()
+
+        self.assertTrue(opened)
+        released = [call.args[0] for call in release.call_args_list]
+        self.assertTrue(all(conn in released for conn in opened))
@@ -67,3 +67,14 @@ class DispatcherViewTests(TestCase):
     def test_exception_in_registered_report_propagates(self) -> None:
         with self.assertRaises(RuntimeError):
             self._dispatch("tests", "boom")
+
+    def test_view_callable_is_built_once_per_registry_key(self) -> None:
+        self._dispatch("tests", "kwargs-probe")
+        index = Diagnostic.get_index()
+        entry = index.lookup("tests", "kwargs-probe")
+        view = index.get_view(entry)
+
+        self._dispatch("tests", "kwargs-probe")
+
+        self.assertIs(index.get_view(entry), view)
+        self.assertIs(view.view_class, KwargsProbeDiagnosticView)
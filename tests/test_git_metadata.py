@@ -0,0 +1,187 @@
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from django_diagnostic.views import (
+    HAS_GIT,
+    DebugView,
+    clear_git_metadata,
+    get_git_metadata,
+    load_version_manifest,
+    read_version_manifest,
+)
+
+
+def git(cwd: str, *args: str) -> str:
+    return subprocess.run(  # noqa: S603
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],  # noqa: S607
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@unittest.skipUnless(HAS_GIT, "GitPython is not installed")
+class GitMetadataCacheTests(SimpleTestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = tmp.name
+        git(self.repo, "init", "-q", "-b", "main")
+        git(self.repo, "commit", "-q", "--allow-empty", "-m", "first")
+        git(self.repo, "tag", "-a", "v1.0", "-m", "v1.0")
+
+        cwd = Path.cwd()
+        os.chdir(self.repo)
+        self.addCleanup(os.chdir, cwd)
+        clear_git_metadata()
+        self.addCleanup(clear_git_metadata)
+
+    def test_metadata_is_resolved_once_until_head_moves(self) -> None:
+        first = get_git_metadata()
+        self.assertEqual(first["git_describe"], "v1.0")
+        self.assertEqual(first["git_active_branch"], "main")
+        self.assertEqual(first["hexsha"], git(self.repo, "rev-parse", "HEAD"))
+        self.assertIs(get_git_metadata(), first)
+
+        git(self.repo, "commit", "-q", "--allow-empty", "-m", "second")
+
+        second = get_git_metadata()
+        self.assertIsNot(second, first)
+        self.assertEqual(second["hexsha"], git(self.repo, "rev-parse", "HEAD"))
+        self.assertTrue(second["git_describe"].startswith("v1.0-1-g"))
+
+    def test_checkout_of_a_detached_head_invalidates(self) -> None:
+        first = get_git_metadata()
+        git(self.repo, "checkout", "-q", "--detach")
+
+        detached = get_git_metadata()
+        self.assertIsNot(detached, first)
+        self.assertTrue(detached["git_detached_head"])
+
+
+@unittest.skipUnless(HAS_GIT, "GitPython is not installed")
+class VersionManifestTests(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = tmp.name
+        git(self.repo, "init", "-q", "-b", "main")
+        git(self.repo, "commit", "-q", "--allow-empty", "-m", "first")
+        git(self.repo, "tag", "-a", "v2.0", "-m", "v2.0")
+        self.manifest = str(Path(self.repo) / "version.json")
+
+        cwd = Path.cwd()
+        os.chdir(self.repo)
+        self.addCleanup(os.chdir, cwd)
+        clear_git_metadata()
+        self.addCleanup(clear_git_metadata)
+        read_version_manifest.cache_clear()
+        self.addCleanup(read_version_manifest.cache_clear)
+
+        self.superuser = get_user_model().objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="password",  # noqa: S106 -- throwaway test fixture, not a real credential
+        )
+
+    def test_command_writes_a_compact_manifest(self) -> None:
+        Path(self.repo, "untracked.txt").write_text("x")
+        call_command("diagnostic_write_version_manifest", self.manifest, verbosity=0)
+
+        text = Path(self.manifest).read_text()
+        self.assertNotIn(" ", text)
+        manifest = json.loads(text)
+        self.assertEqual(manifest["git_describe"], "v2.0")
+        self.assertEqual(manifest["git_active_branch"], "main")
+        self.assertEqual(manifest["hexsha"], git(self.repo, "rev-parse", "HEAD"))
+        self.assertIsNone(manifest["active_branch_tracking_branch"])
+        self.assertFalse(manifest["git_dirty"])
+        self.assertIn("built_at", manifest)
+
+    def test_command_handles_tagless_detached_clones(self) -> None:
+        git(self.repo, "tag", "-d", "v2.0")
+        git(self.repo, "checkout", "-q", "--detach")
+
+        call_command("diagnostic_write_version_manifest", self.manifest, verbosity=0)
+
+        manifest = json.loads(Path(self.manifest).read_text())
+        hexsha = git(self.repo, "rev-parse", "HEAD")
+        self.assertTrue(hexsha.startswith(manifest["git_describe"]))
+        self.assertTrue(manifest["git_detached_head"])
+        self.assertEqual(manifest["hexsha"], hexsha)
+
+    def test_command_reports_unreadable_repositories(self) -> None:
+        with tempfile.TemporaryDirectory() as empty:
+            git(empty, "init", "-q")
+            os.chdir(empty)
+            with self.assertRaises(CommandError):
+                call_command(
+                    "diagnostic_write_version_manifest", self.manifest, verbosity=0
+                )
+
+    def test_command_needs_a_path(self) -> None:
+        with self.assertRaises(CommandError):
+            call_command("diagnostic_write_version_manifest")
+
+    def test_unreadable_manifest_is_retried(self) -> None:
+        with self.assertLogs("django_diagnostic.views", "WARNING"):
+            self.assertIsNone(load_version_manifest(self.manifest))
+
+        Path(self.manifest).write_text('{"git_describe": ')
+        with self.assertLogs("django_diagnostic.views", "WARNING"):
+            self.assertIsNone(load_version_manifest(self.manifest))
+
+        Path(self.manifest).write_text('["v2.0"]')
+        with self.assertLogs("django_diagnostic.views", "WARNING"):
+            self.assertIsNone(load_version_manifest(self.manifest))
+
+        Path(self.manifest).write_text('{"git_describe": "v2.0"}')
+        self.assertEqual(load_version_manifest(self.manifest), {"git_describe": "v2.0"})
+
+    def test_manifest_only_sets_version_keys(self) -> None:
+        Path(self.manifest).write_text(
+            json.dumps({"git_describe": "from-manifest", "view": "clobbered"})
+        )
+        with self.settings(DJANGO_DIAGNOSTIC_VERSION_MANIFEST=self.manifest):
+            view = DebugView()
+            view.setup(RequestFactory().get("/"))
+            context = view.get_context_data()
+
+        self.assertEqual(context["git_describe"], "from-manifest")
+        self.assertIs(context["view"], view)
+
+    def test_pages_prefer_the_manifest_over_git(self) -> None:
+        Path(self.manifest).write_text(
+            json.dumps({"git_describe": "from-manifest", "built_at": "today"})
+        )
+        request = RequestFactory().get("/django_diagnostic/debug/")
+        request.user = self.superuser
+
+        with (
+            self.settings(DJANGO_DIAGNOSTIC_VERSION_MANIFEST=self.manifest),
+            mock.patch("django_diagnostic.views.get_git_metadata") as git_metadata,
+        ):
+            response = DebugView.as_view()(request)
+
+        git_metadata.assert_not_called()
+        self.assertContains(response, "from-manifest")
+        self.assertContains(response, "built at")
+
+    def test_unreadable_manifest_falls_back_to_git(self) -> None:
+        with self.settings(DJANGO_DIAGNOSTIC_VERSION_MANIFEST=self.manifest):
+            view = DebugView()
+            view.setup(RequestFactory().get("/"))
+            context = view.get_context_data()
+
+        self.assertEqual(context["git_describe"], "v2.0")
@@ -0,0 +1,132 @@
+import json
+import tempfile
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.http import HttpResponse
+from django.template.response import TemplateResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from django_diagnostic.encoders import DiagnosticJSONEncoder
+from django_diagnostic.views import DispatcherView, SettingsView
+
+UserModel = get_user_model()
+
+
+class UpperCaseEncoder(DiagnosticJSONEncoder):
+    def encode(self, o: Any) -> str:  # noqa: ANN401
+        return super().encode(o).upper()
+
+
+class DispatcherJSONTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.superuser = UserModel.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="password",  # noqa: S106 -- throwaway test fixture, not a real credential
+        )
+        # keep the GitCodeRunning reports off whatever .git the suite runs in
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        manifest = Path(tmp.name) / "version.json"
+        manifest.write_text(json.dumps({"git_describe": "v1.0", "built_at": "now"}))
+        settings = self.settings(DJANGO_DIAGNOSTIC_VERSION_MANIFEST=str(manifest))
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def _dispatch(self, slug: str, query: str = "", **headers) -> HttpResponse:
+        request = self.factory.get(f"/django_diagnostic/{slug}/{query}", **headers)
+        request.user = self.superuser
+        return DispatcherView.as_view()(
+            request, app_name="django_diagnostic", slug=slug
+        )
+
+    def test_format_json_returns_the_masked_context_without_rendering(self) -> None:
+        with self.assertTemplateNotUsed("django_diagnostic/settings.html"):
+            response = self._dispatch("settings", "?format=json")
+
+        self.assertEqual(response["Content-Type"], "application/json")
+        data = json.loads(response.content)
+        self.assertEqual(data["settings"]["SECRET_KEY"], "******")
+        self.assertEqual(data["settings"]["USE_TZ"], True)
+        self.assertNotIn("view", data)
+        self.assertNotIn(b'", "', response.content)
+
+    def test_accept_header_negotiates_json(self) -> None:
+        response = self._dispatch("environment", HTTP_ACCEPT="application/json")
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertIn("environ", json.loads(response.content))
+        self.assertIn("Accept", response["Vary"])
+
+        html = self._dispatch("environment", HTTP_ACCEPT="text/html,*/*;q=0.8")
+        html.render()
+        self.assertTrue(html["Content-Type"].startswith("text/html"))
+
+    def test_session_json_carries_only_the_page_fields(self) -> None:
+        store = SessionStore()
+        store["_auth_user_id"] = str(self.superuser.pk)
+        store["_auth_user_backend"] = "django.contrib.auth.backends.ModelBackend"
+        store["_auth_user_hash"] = "hash-not-for-export"
+        store["cart"] = "private"
+        store.save()
+
+        response = self._dispatch("sessions", "?format=json")
+
+        [session] = json.loads(response.content)["sessions"]
+        self.assertEqual(session["username"], "admin")
+        self.assertNotIn("auth_user_hash", session)
+        self.assertNotIn(b"hash-not-for-export", response.content)
+        self.assertNotIn(b"private", response.content)
+
+    def test_only_allowlisted_context_is_serialized(self) -> None:
+        data = json.loads(self._dispatch("debug", "?format=json").content)
+        self.assertIn("python_version", data)
+        self.assertNotIn("debug_context", data)
+        self.assertNotIn("view", data)
+
+    def test_reports_without_a_json_view_are_not_acceptable(self) -> None:
+        with mock.patch.object(SettingsView, "json_context_keys", None):
+            format_response = self._dispatch("settings", "?format=json")
+            accept_response = self._dispatch(
+                "settings", headers={"accept": "application/json"}
+            )
+            html_response = self._dispatch("settings")
+
+        for response in (format_response, accept_response):
+            self.assertEqual(response.status_code, 406)
+            self.assertIn("Accept", response["Vary"])
+        self.assertIsInstance(html_response, TemplateResponse)
+
+    @override_settings(
+        DJANGO_DIAGNOSTIC_JSON_ENCODER="tests.test_json_api.UpperCaseEncoder"
+    )
+    def test_encoder_is_pluggable(self) -> None:
+        response = self._dispatch("debug", "?format=json")
+        self.assertIn(b"PYTHON_VERSION", response.content)
+
+
+class DiagnosticJSONEncoderTests(SimpleTestCase):
+    def test_encodes_report_context_values(self) -> None:
+        encoded = json.loads(
+            json.dumps(
+                {
+                    "when": datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+                    "size": Decimal("1.50"),
+                    "pair": ("a", 1),
+                    "tags": {"x"},
+                    "other": object,
+                },
+                cls=DiagnosticJSONEncoder,
+            )
+        )
+        self.assertEqual(encoded["when"], "2026-01-02T03:04:05Z")
+        self.assertEqual(encoded["size"], "1.50")
+        self.assertEqual(encoded["pair"], ["a", 1])
+        self.assertEqual(encoded["tags"], ["x"])
+        self.assertEqual(encoded["other"], "<class 'object'>")
@@ -0,0 +1,134 @@
+from collections import namedtuple
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, override_settings
+
+from django_diagnostic.masking import (
+    SecretMasker,
+    get_secret_masker,
+)
+from django_diagnostic.views import mask_sensitive
+
+
+class SecretMaskerTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.masker = SecretMasker()
+
+    def test_masks_keys_matching_any_sensitive_pattern(self) -> None:
+        self.assertEqual(self.masker.mask("SECRET_KEY", "abc"), "******")
+        self.assertEqual(self.masker.mask("aws_access_key_id", "abc"), "******")
+        self.assertEqual(self.masker.mask("GITHUB_TOKEN", "abc"), "******")
+        self.assertEqual(self.masker.mask("DEBUG_PROPAGATE", "abc"), "abc")
+
+    def test_whitelisted_keys_are_exact_and_case_insensitive(self) -> None:
+        self.assertEqual(self.masker.mask("reset_password", "/r/"), "/r/")
+        self.assertEqual(self.masker.mask("RESET_PASSWORD_URL", "/r/"), "******")
+
+    def test_urls_mask_password_and_secret_query_params(self) -> None:
+        self.assertEqual(
+            self.masker.mask("DATABASE_URL", "postgres://u:hunter2@db/app"),
+            "postgres://u:******@db/app",
+        )
+        self.assertEqual(
+            self.masker.mask("SENTRY_DSN", "https://h/x?sentry_key=abc&env=prod"),
+            "https://h/x?sentry_key=******&env=prod",
+        )
+
+    def test_recurses_into_dicts_and_lists(self) -> None:
+        databases = {
+            "default": {"NAME": "app", "PASSWORD": "hunter2", "PORT": 5432},
+            "HOSTS": ["a", "b"],
+        }
+        self.assertEqual(
+            self.masker.mask("DATABASES", databases),
+            {
+                "default": {"NAME": "app", "PASSWORD": "******", "PORT": 5432},
+                "HOSTS": ["a", "b"],
+            },
+        )
+        self.assertEqual(self.masker.mask("API_KEYS", ["a", "b"]), ["******"] * 2)
+
+    def test_key_decisions_are_memoized(self) -> None:
+        for _ in range(3):
+            self.masker.mask("SECRET_KEY", "abc")
+        self.assertEqual(self.masker.is_sensitive_key.cache_info().misses, 1)
+
+    @override_settings(
+        DJANGO_DIAGNOSTIC_SENSITIVE_KEYS=["DSN"],
+        DJANGO_DIAGNOSTIC_WHITELISTED_KEYS=["PUBLIC_DSN"],
+    )
+    def test_patterns_come_from_settings(self) -> None:
+        masker = get_secret_masker()
+        self.assertIs(get_secret_masker(), masker)
+        self.assertEqual(mask_sensitive("SENTRY_DSN", "x"), "******")
+        self.assertEqual(mask_sensitive("PUBLIC_DSN", "x"), "x")
+        self.assertEqual(mask_sensitive("SECRET_KEY", "x"), "x")
+
+
+Endpoint = namedtuple("Endpoint", ["url", "token"])
+
+
+@dataclass(frozen=True)
+class Credentials:
+    username: str
+    password: str
+
+
+class StructuralMaskingTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.masker = SecretMasker()
+
+    def test_unchanged_trees_are_returned_as_is(self) -> None:
+        logging = {
+            "version": 1,
+            "handlers": {"console": {"class": "logging.StreamHandler"}},
+            "loggers": {"django": {"handlers": ["console"], "level": "INFO"}},
+        }
+        self.assertIs(self.masker.mask("LOGGING", logging), logging)
+
+        admins = (("Admin", "admin@example.com"),)
+        self.assertIs(self.masker.mask("ADMINS", admins), admins)
+
+    def test_only_the_changed_path_is_copied(self) -> None:
+        databases = {
+            "default": {"PASSWORD": "hunter2", "OPTIONS": {"sslmode": "require"}},
+            "replica": {"NAME": "app"},
+        }
+        masked = self.masker.mask("DATABASES", databases)
+
+        self.assertEqual(masked["default"]["PASSWORD"], "******")
+        self.assertEqual(databases["default"]["PASSWORD"], "hunter2")
+        self.assertIs(masked["default"]["OPTIONS"], databases["default"]["OPTIONS"])
+        self.assertIs(masked["replica"], databases["replica"])
+
+    def test_recurses_into_tuples_sets_and_namedtuples(self) -> None:
+        self.assertEqual(
+            self.masker.mask("OPTIONS", ("redis://u:p@h/0", "plain")),
+            ("redis://u:******@h/0", "plain"),
+        )
+        self.assertEqual(self.masker.mask("API_KEYS", frozenset({"a"})), {"******"})
+
+        masked = self.masker.mask("UPSTREAM", Endpoint("https://h/?token=t", "x"))
+        self.assertIsInstance(masked, Endpoint)
+        self.assertEqual(masked.url, "https://h/?token=******")
+
+    def test_recurses_into_dataclasses_and_namespaces(self) -> None:
+        credentials = Credentials("admin", "hunter2")
+        masked = self.masker.mask("SERVICE", credentials)
+        self.assertEqual(masked, Credentials("admin", "******"))
+        self.assertEqual(credentials.password, "hunter2")
+
+        namespace = SimpleNamespace(secret="s", name="n")  # noqa: S106
+        masked = self.masker.mask("CONFIG", namespace)
+        self.assertEqual(vars(masked), {"secret": "******", "name": "n"})
+        self.assertEqual(namespace.secret, "s")
+
+    def test_cycles_are_not_followed(self) -> None:
+        tree = {"PASSWORD": "hunter2", "children": []}
+        tree["children"].append(tree)
+
+        masked = self.masker.mask("TREE", tree)
+
+        self.assertEqual(masked["PASSWORD"], "******")
+        self.assertIs(masked["children"][0], tree)
@@ -0,0 +1,176 @@
+import time
+import unittest
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import caches
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from django_diagnostic.metrics import (
+    OPENMETRICS_CONTENT_TYPE,
+    Metric,
+    collect_metrics,
+    refresh_metric,
+    render_openmetrics,
+)
+from django_diagnostic.models import TaskResultRollup
+from django_diagnostic.reports.celery_results import (
+    HAS_TASK_RESULT,
+    collect_task_metrics,
+)
+from django_diagnostic.reports.postgresql import collect_connection_metrics
+from django_diagnostic.views import MetricsView, collect_session_metrics
+
+if HAS_TASK_RESULT:
+    from django_celery_results.models import TaskResult
+
+UserModel = get_user_model()
+
+COLLECT_CALLS = []
+FAILING = []
+
+
+def counting_collect() -> list[tuple[dict[str, str], int]]:
+    COLLECT_CALLS.append(time.monotonic())
+    if FAILING:
+        raise RuntimeError("collector down")
+    return [({"queue": 'say "hi"\n'}, len(COLLECT_CALLS))]
+
+
+def wait_for_calls(count: int) -> None:
+    deadline = time.monotonic() + 2
+    while len(COLLECT_CALLS) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class MetricsCollectorTests(SimpleTestCase):
+    gauge = Metric("probe_depth", "Depth.", "tests.test_metrics.counting_collect")
+    counter = Metric(
+        "probe_runs",
+        "Runs.",
+        "tests.test_metrics.counting_collect",
+        metric_type="counter",
+    )
+
+    def setUp(self) -> None:
+        COLLECT_CALLS.clear()
+        FAILING.clear()
+        caches["default"].clear()
+
+    def test_fresh_snapshot_is_served_without_collecting(self) -> None:
+        refresh_metric(self.gauge)
+        [(metric, samples, age)] = collect_metrics([self.gauge])
+
+        self.assertIs(metric, self.gauge)
+        self.assertEqual(samples, [({"queue": 'say "hi"\n'}, 1)])
+        self.assertLess(age, 1)
+        self.assertEqual(len(COLLECT_CALLS), 1)
+
+    def test_missing_snapshot_is_collected_in_the_background(self) -> None:
+        self.assertEqual(collect_metrics([self.gauge]), [])
+        wait_for_calls(1)
+        time.sleep(0.05)
+
+        [(_metric, samples, _age)] = collect_metrics([self.gauge])
+        self.assertEqual(samples[0][1], 1)
+
+    @override_settings(DJANGO_DIAGNOSTIC_METRICS_REFRESH_INTERVALS={"probe_depth": 0})
+    def test_stale_snapshot_is_served_while_refreshing(self) -> None:
+        refresh_metric(self.gauge)
+        [(_metric, samples, _age)] = collect_metrics([self.gauge])
+
+        self.assertEqual(samples[0][1], 1)
+        wait_for_calls(2)
+        self.assertEqual(len(COLLECT_CALLS), 2)
+
+    def test_failed_collection_keeps_the_last_snapshot(self) -> None:
+        refresh_metric(self.gauge)
+        FAILING.append(True)
+
+        with self.assertLogs("django_diagnostic.metrics", "WARNING"):
+            self.assertIsNone(refresh_metric(self.gauge))
+        [(_metric, samples, _age)] = collect_metrics([self.gauge])
+        self.assertEqual(samples[0][1], 1)
+
+    def test_renders_openmetrics_text(self) -> None:
+        refresh_metric(self.gauge)
+        refresh_metric(self.counter)
+        text = render_openmetrics(collect_metrics([self.gauge, self.counter]))
+
+        self.assertIn("# TYPE probe_depth gauge\n# HELP probe_depth Depth.\n", text)
+        self.assertIn('probe_depth{queue="say \\"hi\\"\\n"} 1\n', text)
+        self.assertIn("# TYPE probe_runs counter\n", text)
+        self.assertIn('probe_runs_total{queue="say \\"hi\\"\\n"} 2\n', text)
+        self.assertIn('django_diagnostic_metric_age_seconds{metric="probe_runs"}', text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+
+class MetricCollectorsTests(TestCase):
+    def test_session_metrics_count_unexpired_sessions(self) -> None:
+        for hours in (1, 2, -1):
+            store = SessionStore()
+            store.set_expiry(timezone.now() + timedelta(hours=hours))
+            store.save()
+
+        self.assertEqual(collect_session_metrics(), [({}, 2)])
+
+    def test_postgresql_metrics_are_empty_on_other_databases(self) -> None:
+        self.assertEqual(collect_connection_metrics(), [])
+
+    @unittest.skipUnless(HAS_TASK_RESULT, "django-celery-results is not installed")
+    def test_task_metrics_count_outcomes_per_task(self) -> None:
+        done = timezone.now() - timedelta(hours=1)
+        for i, status in enumerate(("SUCCESS", "SUCCESS", "FAILURE")):
+            result = TaskResult.objects.create(
+                task_id=f"task-{i}", task_name="tasks.a", status=status
+            )
+            TaskResult.objects.filter(pk=result.pk).update(
+                date_created=done, date_done=done
+            )
+        TaskResultRollup.objects.update_from_task_results()
+
+        self.assertEqual(
+            collect_task_metrics(),
+            [
+                ({"task_name": "tasks.a", "status": "success"}, 2),
+                ({"task_name": "tasks.a", "status": "failure"}, 1),
+            ],
+        )
+
+
+@override_settings(DJANGO_DIAGNOSTIC_METRICS_TOKEN="scrape-token")  # noqa: S106
+class MetricsViewTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+
+    def test_bearer_token_is_accepted(self) -> None:
+        response = self.client.get(
+            reverse("django_diagnostic:metrics"),
+            headers={"authorization": "Bearer scrape-token"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], OPENMETRICS_CONTENT_TYPE)
+        self.assertTrue(response.content.endswith(b"# EOF\n"))
+
+    def test_wrong_token_and_anonymous_requests_are_refused(self) -> None:
+        url = reverse("django_diagnostic:metrics")
+        response = self.client.get(url, headers={"authorization": "Bearer nope"})
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_superusers_are_allowed(self) -> None:
+        superuser = UserModel.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="password",  # noqa: S106 -- throwaway test fixture, not a real credential
+        )
+        request = self.factory.get("/metrics/")
+        request.user = superuser
+        self.assertEqual(MetricsView.as_view()(request).status_code, 200)
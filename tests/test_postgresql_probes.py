@@ -0,0 +1,289 @@
+import os
+import time
+import unittest
+from typing import Any
+from unittest import mock
+
+import psycopg2
+import pytest
+from django.core.cache import caches
+from django.template.loader import render_to_string
+from django.test import SimpleTestCase, TestCase, override_settings
+from psycopg2.errorcodes import OBJECT_NOT_IN_PREREQUISITE_STATE, UNDEFINED_TABLE
+from psycopg2.extensions import STATUS_READY
+
+from django_diagnostic.reports.postgresql import (
+    INDEX_HEALTH_PROBES,
+    METRIC_PROBES,
+    PG_STAT_STATEMENTS_ORDERINGS,
+    POSTGRESQL_PROBES,
+    TABLE_VACUUM_ORDERINGS,
+    Probe,
+    collect_connection_info,
+    fetch_scalar,
+    pg_stat_statements_probe,
+    run_probes,
+    table_vacuum_probe,
+)
+
+
+def sleep_then_fetch(cursor: Any, sql: str) -> Any:  # noqa: ANN401
+    time.sleep(0.3)
+    return fetch_scalar(cursor, sql)
+
+
+class RunProbesTests(TestCase):
+    def test_collects_results_and_errors_by_probe_name(self) -> None:
+        results, statuses = run_probes(
+            [
+                Probe("one", "SELECT 1", fetch_scalar),
+                Probe("broken", "SELECT * FROM no_such_table"),
+            ]
+        )
+
+        self.assertEqual(results["one"], 1)
+        self.assertEqual(statuses["one"]["status"], "ok")
+        self.assertIsNotNone(statuses["one"]["elapsed_ms"])
+        self.assertIsNone(results["broken"])
+        self.assertEqual(statuses["broken"]["status"], "error")
+
+    def test_probes_run_concurrently(self) -> None:
+        started = time.perf_counter()
+        results, statuses = run_probes(
+            [Probe(f"slow-{i}", "SELECT 1", sleep_then_fetch) for i in range(3)]
+        )
+
+        self.assertEqual({s["status"] for s in statuses.values()}, {"ok"})
+        self.assertEqual(set(results.values()), {1})
+        self.assertLess(time.perf_counter() - started, 0.8)
+
+    @override_settings(DJANGO_DIAGNOSTIC_POSTGRESQL_PROBE_TIMEOUT=0.05)
+    def test_slow_probe_times_out_without_failing_the_rest(self) -> None:
+        results, statuses = run_probes(
+            [
+                Probe("fast", "SELECT 1", fetch_scalar),
+                Probe("slow", "SELECT 1", sleep_then_fetch),
+            ]
+        )
+
+        self.assertEqual(results["fast"], 1)
+        self.assertIsNone(results["slow"])
+        self.assertEqual(statuses["slow"]["status"], "timeout")
+        self.assertEqual(statuses["slow"]["error"], "timed out after 50 ms")
+
+
+class ProbeStatusTemplateTests(SimpleTestCase):
+    def test_renders_timing_and_timeouts(self) -> None:
+        ok = render_to_string(
+            "django_diagnostic/probe_status.html",
+            {"probe": {"status": "ok", "elapsed_ms": 12, "error": None}},
+        )
+        timed_out = render_to_string(
+            "django_diagnostic/probe_status.html",
+            {"probe": {"status": "timeout", "error": "timed out after 2000 ms"}},
+        )
+
+        self.assertIn("12 ms", ok)
+        self.assertIn("timed out after 2000 ms", timed_out)
+
+
+COUNTING_CALLS = []
+
+
+def counting_fetch(cursor: Any, sql: str) -> Any:  # noqa: ANN401
+    COUNTING_CALLS.append(sql)
+    return fetch_scalar(cursor, sql)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ProbeSnapshotTests(TestCase):
+    probe = Probe("snapshotted", "SELECT 1", counting_fetch, snapshot=True)
+
+    def setUp(self) -> None:
+        COUNTING_CALLS.clear()
+        caches["default"].clear()
+
+    def test_fresh_snapshot_is_served_without_querying(self) -> None:
+        run_probes([self.probe])
+        results, statuses = run_probes([self.probe])
+
+        self.assertEqual(results["snapshotted"], 1)
+        self.assertEqual(statuses["snapshotted"]["snapshot_age"], 0)
+        self.assertFalse(statuses["snapshotted"]["stale"])
+        self.assertEqual(len(COUNTING_CALLS), 1)
+
+    def test_refresh_bypasses_snapshot(self) -> None:
+        run_probes([self.probe])
+        _results, statuses = run_probes([self.probe], refresh=True)
+
+        self.assertNotIn("snapshot_age", statuses["snapshotted"])
+        self.assertEqual(len(COUNTING_CALLS), 2)
+
+    @override_settings(DJANGO_DIAGNOSTIC_POSTGRESQL_SNAPSHOT_TTL=0)
+    def test_stale_snapshot_is_served_while_refreshing_in_background(self) -> None:
+        run_probes([self.probe])
+        results, statuses = run_probes([self.probe])
+
+        self.assertEqual(results["snapshotted"], 1)
+        self.assertTrue(statuses["snapshotted"]["stale"])
+        deadline = time.monotonic() + 2
+        while len(COUNTING_CALLS) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(COUNTING_CALLS), 2)
+
+    @override_settings(DJANGO_DIAGNOSTIC_POSTGRESQL_SNAPSHOT_TTL=0)
+    def test_zero_ttl_still_refreshes_once_at_a_time(self) -> None:
+        run_probes([self.probe])
+        with mock.patch(
+            "django_diagnostic.reports.postgresql.get_probe_executor"
+        ) as get_probe_executor:
+            run_probes([self.probe])
+            run_probes([self.probe])
+
+        get_probe_executor.return_value.submit.assert_called_once()
+
+
+class StubConnectionInfo:
+    backend_pid = 4242
+    protocol_version = 3
+    host = "db"
+    port = 5432
+    user = "app"
+    ssl_in_use = True
+    ssl_attribute_names = ("protocol", "cipher")
+
+    def parameter_status(self, name: str) -> str | None:
+        return {"server_encoding": "UTF8", "TimeZone": "UTC"}.get(name)
+
+    def ssl_attribute(self, name: str) -> str:
+        return {"protocol": "TLSv1.3", "cipher": "TLS_AES_256_GCM_SHA384"}[name]
+
+
+class StubPGConnection:
+    server_version = 160004
+    status = STATUS_READY
+    dsn = "dbname=app user=app host=db"
+    encoding = "UTF8"
+    info = StubConnectionInfo()
+
+
+class StubConnectionWrapper:
+    connection = StubPGConnection()
+    ensured = 0
+
+    def ensure_connection(self) -> None:
+        self.ensured += 1
+
+    def cursor(self) -> None:
+        raise AssertionError("collect_connection_info must not open a cursor")
+
+
+class CollectConnectionInfoTests(SimpleTestCase):
+    def test_reads_everything_from_one_handle(self) -> None:
+        conn = StubConnectionWrapper()
+        info = collect_connection_info(conn)
+
+        self.assertEqual(conn.ensured, 1)
+        self.assertEqual(info["server_version"], 160004)
+        self.assertEqual(info["status"], f"Ready ({STATUS_READY})")
+        self.assertEqual(info["backend_pid"], 4242)
+        self.assertEqual(
+            info["parameters"], {"server_encoding": "UTF8", "TimeZone": "UTC"}
+        )
+        self.assertEqual(info["ssl"]["protocol"], "TLSv1.3")
+
+
+POSTGRES_DSN = os.environ.get("DJANGO_DIAGNOSTIC_TEST_POSTGRES_DSN")
+
+
+@pytest.mark.integration
+@unittest.skipUnless(POSTGRES_DSN, "set DJANGO_DIAGNOSTIC_TEST_POSTGRES_DSN")
+class ProbeSQLTests(SimpleTestCase):
+    """
+    Every probe's SQL against a real server: the suite itself runs on
+    SQLite, which can't catch PostgreSQL type or function errors.
+    """
+
+    def setUp(self) -> None:
+        self.conn = psycopg2.connect(POSTGRES_DSN)
+        self.addCleanup(self.conn.close)
+        with self.conn.cursor() as cursor:
+            # an indexed, analyzed table so the estimates have rows to chew on
+            cursor.execute(
+                "CREATE TEMP TABLE probe_sql (id serial PRIMARY KEY, name text);"
+                "CREATE INDEX ON probe_sql (name);"
+                "INSERT INTO probe_sql (name)"
+                " SELECT md5(i::text) FROM generate_series(1, 1000) i;"
+                "ANALYZE probe_sql;"
+            )
+        self.server_version = self.conn.server_version
+
+    def probes(self) -> list[Probe]:
+        return [
+            *POSTGRESQL_PROBES,
+            *INDEX_HEALTH_PROBES,
+            *METRIC_PROBES.values(),
+            *(
+                pg_stat_statements_probe(self.server_version, order)
+                for order in PG_STAT_STATEMENTS_ORDERINGS
+            ),
+            *(table_vacuum_probe(sort) for sort in TABLE_VACUUM_ORDERINGS),
+        ]
+
+    def test_every_probe_runs_on_postgresql(self) -> None:
+        for probe in self.probes():
+            with self.subTest(probe=probe.name), self.conn.cursor() as cursor:
+                cursor.execute("SAVEPOINT probe;")
+                try:
+                    probe.fetch(cursor, probe.sql)
+                except psycopg2.Error as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT probe;")
+                    # pg_stat_statements is optional; its report says so
+                    if probe.name == "pg_stat_statements" and e.pgcode in (
+                        UNDEFINED_TABLE,
+                        OBJECT_NOT_IN_PREREQUISITE_STATE,
+                    ):
+                        continue
+                    self.fail(f"{probe.name}: {e}")
+
+    def test_duplicate_indexes_respect_ordering_collation_and_include(self) -> None:
+        (probe,) = (p for p in INDEX_HEALTH_PROBES if p.name == "duplicate_indexes")
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE probe_dup (a int, b int, c text);"
+                "CREATE INDEX dup_a ON probe_dup (a);"
+                "CREATE INDEX dup_ab ON probe_dup (a, b);"
+                "CREATE INDEX dup_a_desc ON probe_dup (a DESC);"
+                "CREATE INDEX dup_a_incl ON probe_dup (a) INCLUDE (c);"
+                "CREATE INDEX dup_c ON probe_dup (c);"
+                'CREATE INDEX dup_c_collate ON probe_dup (c COLLATE "C");'
+            )
+            rows = probe.fetch(cursor, probe.sql)
+
+        self.assertEqual(
+            {(row[2], row[3]) for row in rows if row[1] == "probe_dup"},
+            {("dup_a", "dup_ab"), ("dup_a", "dup_a_incl")},
+        )
+
+    def test_partitioned_tables_have_no_xid_age(self) -> None:
+        probe = table_vacuum_probe("xid_age", limit=1000)
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE probe_parted (id int) PARTITION BY RANGE (id);"
+                "CREATE TEMP TABLE probe_part PARTITION OF probe_parted"
+                " FOR VALUES FROM (0) TO (100);"
+            )
+            cursor.execute(probe.sql)
+            columns = [column.name for column in cursor.description]
+            rows = [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+
+        ages = {
+            row["relname"]: (row["xid_age"], row["xid_age_percent"])
+            for row in rows
+            if row["relname"].startswith("probe_part")
+        }
+        self.assertEqual(ages["probe_parted"], (None, None))
+        self.assertIsNotNone(ages["probe_part"][0])
+        self.assertIsNone(rows[-1]["xid_age"])
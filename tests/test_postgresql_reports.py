@@ -0,0 +1,88 @@
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from django_diagnostic.reports.postgresql import (
+    IndexHealthView,
+    PgStatStatementsView,
+    TableVacuumView,
+    pg_stat_statements_probe,
+    table_vacuum_probe,
+)
+
+UserModel = get_user_model()
+
+
+class PgStatStatementsProbeTests(SimpleTestCase):
+    def test_uses_exec_time_columns_from_postgresql_13(self) -> None:
+        self.assertIn("total_exec_time", pg_stat_statements_probe(130000).sql)
+        self.assertIn("total_time", pg_stat_statements_probe(120000).sql)
+        self.assertNotIn("exec_time", pg_stat_statements_probe(120000).sql)
+
+    def test_ranking_and_limit_are_server_side(self) -> None:
+        sql = pg_stat_statements_probe(160000, order="misses", limit=5).sql
+        self.assertIn("ORDER BY shared_blks_read DESC", sql)
+        self.assertIn("LIMIT 5;", sql)
+
+    def test_unknown_ordering_falls_back_to_total_time(self) -> None:
+        sql = pg_stat_statements_probe(160000, order="1; DROP TABLE x").sql
+        self.assertIn("ORDER BY total_time DESC", sql)
+        self.assertNotIn("DROP", sql)
+
+
+class TableVacuumProbeTests(SimpleTestCase):
+    def test_sorting_and_pagination_are_server_side(self) -> None:
+        sql = table_vacuum_probe("xid_age", limit=51, offset=100).sql
+        self.assertIn("ORDER BY xid_age DESC NULLS LAST, s.relid", sql)
+        self.assertIn("LIMIT 51 OFFSET 100;", sql)
+
+    def test_unknown_sort_falls_back_to_dead_ratio(self) -> None:
+        sql = table_vacuum_probe("relname; DROP TABLE x").sql
+        self.assertIn("ORDER BY dead_ratio DESC NULLS LAST", sql)
+
+
+class PostgreSQLReportViewTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.superuser = UserModel.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="password",  # noqa: S106 -- throwaway test fixture, not a real credential
+        )
+
+    def _get(self, view_class: type, path: str) -> HttpResponse:
+        request = self.factory.get(path)
+        request.user = self.superuser
+        return view_class.as_view()(request)
+
+    def test_statements_report_degrades_without_the_extension(self) -> None:
+        response = self._get(
+            PgStatStatementsView, "/django_diagnostic/database-postgresql-statements/"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data["statements"], [])
+        self.assertIsNotNone(response.context_data["unavailable"])
+        self.assertContains(response, "alert-warning")
+
+    def test_index_health_renders_each_section_independently(self) -> None:
+        response = self._get(
+            IndexHealthView, "/django_diagnostic/database-postgresql-index-health/"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.context_data["db_probes"]),
+            {"unused_indexes", "duplicate_indexes", "bloated_indexes"},
+        )
+        self.assertContains(response, "Estimated Index Bloat")
+
+    def test_vacuum_report_renders_when_the_probe_fails(self) -> None:
+        response = self._get(
+            TableVacuumView, "/django_diagnostic/database-postgresql-vacuum/?page=x"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data["page"], 1)
+        self.assertEqual(response.context_data["tables"], [])
+        self.assertIsNone(response.context_data["next_page"])
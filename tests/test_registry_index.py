@@ -0,0 +1,88 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.views.generic import TemplateView
+
+from django_diagnostic.decorators import Diagnostic, RegistryIndex
+
+
+class RegistryIndexTests(SimpleTestCase):
+    def _register(self, slug: str) -> str:
+        registry_key = Diagnostic.build_registry_key("tests", slug)
+        Diagnostic.registry[registry_key] = {
+            "name": "RegistryIndexTests",
+            "module": "tests.test_registry_index",
+            "app_name": "tests",
+            "slug": slug,
+            "args": (),
+            "kwargs": {"link_name": slug.title()},
+        }
+        self.addCleanup(Diagnostic.registry.pop, registry_key, None)
+        return registry_key
+
+    def test_index_is_reused_until_the_registry_changes(self) -> None:
+        index = Diagnostic.get_index()
+        self.assertIs(Diagnostic.get_index(), index)
+
+        registry_key = self._register("index-probe")
+
+        rebuilt = Diagnostic.get_index()
+        self.assertIsNot(rebuilt, index)
+        self.assertIn(registry_key, rebuilt.by_key)
+        self.assertEqual(
+            [e.registry_key for e in rebuilt.entries], sorted(Diagnostic.registry)
+        )
+        self.assertIn(rebuilt.by_key[registry_key], rebuilt.by_app["tests"])
+
+        del Diagnostic.registry[registry_key]
+        self.assertNotIn(registry_key, Diagnostic.get_index().by_key)
+
+    def test_lookup_matches_registered_paths_without_slugifying(self) -> None:
+        registry_key = self._register("lookup-probe")
+        index = Diagnostic.get_index()
+
+        with mock.patch.object(
+            Diagnostic, "build_registry_key", wraps=Diagnostic.build_registry_key
+        ) as build_registry_key:
+            entry = index.lookup("tests", "lookup-probe")
+            build_registry_key.assert_not_called()
+
+            # non-canonical spellings still resolve through the registry key
+            self.assertIs(index.lookup("Tests", "Lookup-Probe"), entry)
+            self.assertIsNone(index.lookup("tests", "missing"))
+
+        self.assertEqual(entry.registry_key, registry_key)
+
+    def test_views_are_resolved_once_per_index(self) -> None:
+        self._register("resolve-probe")
+        index = Diagnostic.get_index()
+        entry = index.lookup("tests", "resolve-probe")
+
+        with mock.patch(
+            "django_diagnostic.decorators.cached_import",
+            return_value=RegistryIndexTests,
+        ) as cached_import:
+            first = index.resolve(entry)
+            self.assertIs(index.resolve(entry), first)
+
+        cached_import.assert_called_once()
+        self.assertIs(first.view_class, RegistryIndexTests)
+
+    def test_import_failures_are_retried(self) -> None:
+        self._register("retry-probe")
+        index = Diagnostic.get_index()
+        entry = index.lookup("tests", "retry-probe")
+
+        with mock.patch(
+            "django_diagnostic.decorators.cached_import",
+            side_effect=[ImportError("not yet"), ImportError("not yet"), TemplateView],
+        ):
+            self.assertEqual(index.resolve(entry).import_error, "not yet")
+            self.assertIsNone(index.get_view(entry))
+            self.assertIsNotNone(index.get_view(entry))
+            self.assertIs(index.resolve(entry).view_class, TemplateView)
+
+    def test_index_is_read_only(self) -> None:
+        index = RegistryIndex({})
+        with self.assertRaises(TypeError):
+            index.by_key["x"] = None  # ty: ignore[invalid-assignment]
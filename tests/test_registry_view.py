@@ -1,6 +1,9 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, TestCase, override_settings
 
+from django_diagnostic import autodiscover
 from django_diagnostic.decorators import Diagnostic
 from django_diagnostic.views import RegistryDiagnosticView
 
@@ -49,3 +52,49 @@ class RegistryDiagnosticViewTests(TestCase):
             self.assertEqual(context["failed_count"], 1)
         finally:
             del Diagnostic.registry[registry_key]
+
+    def test_host_app_diagnostic_modules_are_autodiscovered_once(self) -> None:
+        discovered = Diagnostic.discovered
+        self.assertEqual(
+            [d["module"] for d in discovered], ["tests.diagnostic_app.diagnostic"]
+        )
+        self.assertIsNone(discovered[0]["error"])
+        self.assertIn(
+            Diagnostic.build_registry_key("tests", "autodiscovered"),
+            Diagnostic.registry,
+        )
+
+        autodiscover()
+        self.assertIs(Diagnostic.discovered, discovered)
+
+    def _rediscover_failing(self) -> None:
+        discovered = Diagnostic.discovered
+        Diagnostic.discovered = None
+        self.addCleanup(setattr, Diagnostic, "discovered", discovered)
+        with mock.patch(
+            "django_diagnostic.import_module", side_effect=ImportError("boom")
+        ):
+            autodiscover()
+
+    def test_failing_host_module_surfaces_the_error(self) -> None:
+        with self.assertRaisesMessage(ImportError, "boom"):
+            self._rediscover_failing()
+        self.assertIsNone(Diagnostic.discovered)
+
+    @override_settings(DJANGO_DIAGNOSTIC_AUTODISCOVER_IGNORE_ERRORS=True)
+    def test_failing_host_module_can_be_recorded_instead(self) -> None:
+        with self.assertLogs("django_diagnostic", "ERROR"):
+            self._rediscover_failing()
+        self.assertEqual(Diagnostic.discovered[0]["error"], "ImportError: boom")
+
+    def test_shows_autodiscovery_import_times(self) -> None:
+        context = self._render()
+        self.assertEqual(
+            context["discovered"][0]["module"], "tests.diagnostic_app.diagnostic"
+        )
+        self.assertGreaterEqual(context["discovered_ms"], 0)
+
+        request = self.factory.get("/django_diagnostic/diagnostic-reports-registry/")
+        request.user = self.superuser
+        response = RegistryDiagnosticView.as_view()(request)
+        self.assertContains(response, "tests.diagnostic_app.diagnostic")
@@ -0,0 +1,171 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.http import HttpRequest
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from django_diagnostic.views import (
+    SessionsView,
+    encode_session_cursor,
+    iter_session_chunks,
+)
+
+UserModel = get_user_model()
+
+
+class SessionsViewTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.superuser = UserModel.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="password",  # noqa: S106 -- throwaway test fixture, not a real credential
+        )
+        now = timezone.now()
+        for i in range(5):
+            store = SessionStore()
+            store["_auth_user_id"] = str(self.superuser.pk)
+            store["_auth_user_backend"] = "django.contrib.auth.backends.ModelBackend"
+            store.set_expiry(now + timedelta(hours=i + 1))
+            store.save()
+
+        expired = SessionStore()
+        expired.set_expiry(now - timedelta(hours=1))
+        expired.save()
+
+    def _request(self, path: str = "/django_diagnostic/sessions/") -> HttpRequest:
+        request = self.factory.get(path)
+        request.user = self.superuser
+        return request
+
+    def _render(self, path: str = "/django_diagnostic/sessions/") -> dict:
+        view = SessionsView()
+        view.setup(self._request(path))
+        return view.get_context_data()
+
+    @override_settings(DJANGO_DIAGNOSTIC_SESSIONS_PAGE_SIZE=2)
+    def test_keyset_pages_walk_every_unexpired_session_once(self) -> None:
+        seen = []
+        context = self._render()
+        self.assertTrue(context["is_first_page"])
+        while True:
+            page = list(context["decoded_sessions"].values())
+            self.assertLessEqual(len(page), 2)
+            seen.extend(page)
+            if not context["next_cursor"]:
+                break
+            self.assertEqual(context["next_cursor"], encode_session_cursor(page[-1]))
+            context = self._render(
+                f"/django_diagnostic/sessions/?after={context['next_cursor']}"
+            )
+
+        expire_dates = [session["expire_date"] for session in seen]
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(expire_dates, sorted(expire_dates))
+        self.assertEqual({session["username"] for session in seen}, {"admin"})
+
+    @override_settings(DJANGO_DIAGNOSTIC_SESSIONS_CHUNK_SIZE=2)
+    def test_user_lookups_are_batched_per_chunk(self) -> None:
+        # session page query + one user query per chunk of two sessions
+        with self.assertNumQueries(4):
+            context = self._render()
+        self.assertEqual(len(context["decoded_sessions"]), 5)
+
+    def test_stream_mode_renders_rows_incrementally(self) -> None:
+        response = SessionsView.as_view()(
+            self._request("/django_diagnostic/sessions/?stream=1")
+        )
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content).decode()
+        self.assertEqual(content.count("ModelBackend"), 5)
+        self.assertIn("</table>", content)
+
+    def test_summary_mode_counts_in_sql_and_estimates_from_sample(self) -> None:
+        anonymous = SessionStore()
+        anonymous["attributes"] = {}
+        anonymous.save()
+
+        context = self._render("/django_diagnostic/sessions/?mode=summary&sample=1")
+        summary = context["summary"]
+
+        self.assertEqual(summary["active"], 6)
+        self.assertEqual(summary["sample_size"], 6)
+        self.assertEqual(summary["authenticated"], 5)
+        self.assertEqual(summary["anonymous"], 1)
+        self.assertEqual(
+            summary["backends"], [("django.contrib.auth.backends.ModelBackend", 5)]
+        )
+        self.assertEqual(summary["users"][0]["username"], "admin")
+        self.assertEqual(sum(b["total"] for b in summary["expiry_histogram"]), 6)
+
+        response = SessionsView.as_view()(
+            self._request("/django_diagnostic/sessions/?mode=summary")
+        )
+        self.assertContains(response, "Sessions per Auth Backend")
+
+    def test_summary_sample_is_bounded_by_key_range(self) -> None:
+        context = self._render("/django_diagnostic/sessions/?mode=summary&sample=0.001")
+        summary = context["summary"]
+
+        self.assertEqual(summary["active"], 5)
+        self.assertLessEqual(summary["sample_size"], 5)
+
+    @override_settings(DJANGO_DIAGNOSTIC_SESSIONS_SAMPLE_RATE=0.5)
+    def test_invalid_sample_rates_fall_back_to_the_setting(self) -> None:
+        for sample in ("nan", "inf", "-inf", "-0.5", "0", "bogus"):
+            with self.subTest(sample=sample):
+                context = self._render(
+                    f"/django_diagnostic/sessions/?mode=summary&sample={sample}"
+                )
+                self.assertEqual(context["summary"]["sample_rate"], 0.5)
+
+        context = self._render("/django_diagnostic/sessions/?mode=summary&sample=7")
+        self.assertEqual(context["summary"]["sample_rate"], 1.0)
+
+    @override_settings(
+        DJANGO_DIAGNOSTIC_SESSIONS_DECODE_EXECUTOR="thread",
+        DJANGO_DIAGNOSTIC_SESSIONS_DECODE_WORKERS=2,
+        DJANGO_DIAGNOSTIC_SESSIONS_DECODE_BATCH_SIZE=2,
+    )
+    def test_pooled_decoding_keeps_expire_date_order(self) -> None:
+        pooled = [s for chunk in iter_session_chunks(chunk_size=4) for s in chunk]
+        with self.settings(DJANGO_DIAGNOSTIC_SESSIONS_DECODE_EXECUTOR=None):
+            serial = [s for chunk in iter_session_chunks(chunk_size=4) for s in chunk]
+
+        self.assertEqual(pooled, serial)
+        self.assertEqual(len(pooled), 5)
+
+
+@override_settings(USE_TZ=False, DJANGO_DIAGNOSTIC_SESSIONS_PAGE_SIZE=1)
+class NaiveSessionsViewTests(TestCase):
+    def setUp(self) -> None:
+        self.superuser = UserModel.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="password",  # noqa: S106 -- throwaway test fixture, not a real credential
+        )
+        now = timezone.now()
+        for i in range(3):
+            store = SessionStore()
+            store.set_expiry(now + timedelta(hours=i + 1))
+            store.save()
+
+    def test_cursor_round_trips_naive_expire_dates(self) -> None:
+        seen = []
+        path = "/django_diagnostic/sessions/"
+        while path:
+            request = RequestFactory().get(path)
+            request.user = self.superuser
+            view = SessionsView()
+            view.setup(request)
+            context = view.get_context_data()
+            seen.extend(context["decoded_sessions"].values())
+            cursor = context["next_cursor"]
+            path = cursor and f"/django_diagnostic/sessions/?after={cursor}"
+
+        expire_dates = [session["expire_date"] for session in seen]
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(expire_dates, sorted(expire_dates))
+        self.assertTrue(all(timezone.is_naive(date) for date in expire_dates))
@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.test import SimpleTestCase
+
+from django_diagnostic.decorators import Diagnostic
+from django_diagnostic.views import LAZY_REPORTS
+
+# Modules that must stay unloaded until one of their reports is dispatched.
+LAZY_MODULES = (
+    "git",
+    "psycopg2",
+    "django_diagnostic.reports.celery_workers",
+    "django_diagnostic.reports.celery_results",
+    "django_diagnostic.reports.postgresql",
+)
+
+STARTUP = """
+import json, sys, django
+django.setup()
+import django_diagnostic.urls
+{extra}
+print(json.dumps([m for m in {modules!r} if m in sys.modules]))
+"""
+
+
+def run_startup(extra: str = "") -> list[str]:
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            STARTUP.format(extra=extra, modules=LAZY_MODULES),
+        ],
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "tests.settings"},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+class LazyReportTests(SimpleTestCase):
+    def test_importing_urls_loads_no_optional_integrations(self) -> None:
+        self.assertEqual(run_startup(), [])
+
+    def test_lazy_reports_are_registered_by_path(self) -> None:
+        modules = {entry["module"] for entry in Diagnostic.registry.values()}
+        for dotted_path in LAZY_REPORTS:
+            self.assertIn(dotted_path.rpartition(".")[0], modules)
+
+    def test_views_still_exposes_the_moved_reports(self) -> None:
+        from django_diagnostic import views
+        from django_diagnostic.reports.postgresql import DatabasePostgreSQLView
+
+        self.assertIs(views.DatabasePostgreSQLView, DatabasePostgreSQLView)
+        with self.assertRaises(AttributeError):
+            views.NoSuchReport  # noqa: B018
+
+    def test_views_still_exposes_the_moved_helpers(self) -> None:
+        from django_diagnostic import views
+        from django_diagnostic.reports import celery_results, postgresql
+
+        self.assertIs(views.fetch_scalar, postgresql.fetch_scalar)
+        self.assertIs(views.fetch_all, postgresql.fetch_all)
+        self.assertIs(views.STATUS_MAP, postgresql.STATUS_MAP)
+        self.assertIs(views.HAS_TASK_RESULT, celery_results.HAS_TASK_RESULT)
+        if celery_results.HAS_TASK_RESULT:
+            self.assertIs(views.TaskResult, celery_results.TaskResult)